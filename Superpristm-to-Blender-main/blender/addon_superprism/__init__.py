@@ -20,7 +20,7 @@ if os.path.dirname(__file__) not in sys.path:
 from . import import_full_scene
 from . import panel
 
-# List of modules to reload
+# List of modules to reload (dev only, see SUPERPRISM_OT_dev_reload)
 modules_to_reload = [
     import_full_scene,
     panel
@@ -33,10 +33,6 @@ class SUPERPRISM_OT_import_scene(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        # Force reload modules
-        for mod in modules_to_reload:
-            importlib.reload(mod)
-            
         try:
             import_full_scene.main()
             self.report({'INFO'}, "Import Complete!")
@@ -60,9 +56,22 @@ class SUPERPRISM_OT_clear_scene(bpy.types.Operator):
             self.report({'ERROR'}, f"Clear Failed: {e}")
         return {'FINISHED'}
 
+class SUPERPRISM_OT_dev_reload(bpy.types.Operator):
+    """Reload the add-on's pipeline modules after editing them (development only)"""
+    bl_idname = "superprism.dev_reload"
+    bl_label = "Reload SuperPrism Modules (Dev)"
+
+    def execute(self, context):
+        for mod in modules_to_reload:
+            importlib.reload(mod)
+        import_full_scene._reload_all()
+        self.report({'INFO'}, "SuperPrism modules reloaded")
+        return {'FINISHED'}
+
 classes = (
     SUPERPRISM_OT_import_scene,
     SUPERPRISM_OT_clear_scene,
+    SUPERPRISM_OT_dev_reload,
     panel.SUPERPRISM_PT_main_panel,
 )
 
@@ -9,16 +9,29 @@ The script builds Principled BSDF materials from all images in
 import os
 import json
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, Iterable, Optional, Tuple
 
 import bpy
 
+try:
+    from . import paths
+except ImportError:
+    import paths
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # -----------------------------
 # CONFIGURATION
 # -----------------------------
 TEXTURE_DIR = "assets/textures"  # Repo-root relative
 MAPPING_FILE = "assets/scene_materials.json"
 IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".tga", ".bmp", ".tif", ".tiff")
+DEBUG = False  # Print mapping/object name samples before assigning
 
 # Shader Defaults
 DEFAULT_ROUGHNESS = 0.5
@@ -35,33 +48,59 @@ SLOTS = {
 }
 # -----------------------------
 
+# Texture file naming: material_name + "__" + slot_name + extension
+_NAME_SLOT_RE = re.compile(r"(.+)__(.+)\.(\w+)")
+_VIFS_RE = re.compile(r"(VIFS\d+)", re.IGNORECASE)
+_SEP_RE = re.compile(r"[-_.]")
+_EXT_SET = frozenset(ext.lower() for ext in IMAGE_EXTENSIONS)
+# Formats that can carry an alpha channel
+_ALPHA_EXTENSIONS = frozenset((".png", ".tga", ".tif", ".tiff"))
+
+# material.name_full -> [principled node, texture node count]; reset per build
+_BSDF_CACHE: Dict[str, list] = {}
+# image.name_full -> (raw filepath, normalized absolute path)
+_IMG_PATH_CACHE: Dict[str, Tuple[str, str]] = {}
+
+
+@lru_cache(maxsize=64)
+def _resolve(path: str, base: str) -> str:
+    resolved = os.path.abspath(os.path.join(base, path))
+    print(f"[auto_materials] Resolved path: {resolved}")
+    return resolved
+
 
 def resolve_repo_path(path: str) -> str:
-    """Resolve ``path`` relative to the .blend when saved, else repo root."""
+    """Resolve ``path`` relative to the repo root."""
     if os.path.isabs(path):
         return path
+    return _resolve(path, paths.PROJECT_ROOT)
 
-    # Addon structure: blender/addon_superprism/auto_materials.py
-    # Project root is two levels up
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    
-    fallback_root = r"C:\Users\Shadow\Desktop\Superpristm-to-Blender-main"
-    if not os.path.exists(os.path.join(project_root, "assets")):
-        if os.path.exists(fallback_root):
-            project_root = fallback_root
 
-    resolved = os.path.abspath(os.path.join(project_root, path))
-    print(f"[auto_materials] Resolved path: {resolved}")
-    return resolved
+def _img_abs(img: bpy.types.Image) -> str:
+    """Normalized absolute path of ``img``, cached until its filepath changes."""
+    raw = img.filepath
+    cached = _IMG_PATH_CACHE.get(img.name_full)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+    abs_path = os.path.abspath(bpy.path.abspath(raw))
+    _IMG_PATH_CACHE[img.name_full] = (raw, abs_path)
+    return abs_path
 
 
-def load_image(path: str) -> bpy.types.Image:
+def _build_image_index() -> Dict[str, bpy.types.Image]:
+    """Map absolute file path -> already loaded image."""
+    return {_img_abs(img): img for img in bpy.data.images if img.filepath}
+
+
+def load_image(path: str, index: Optional[Dict[str, bpy.types.Image]] = None) -> bpy.types.Image:
     abs_path = os.path.abspath(path)
-    for img in bpy.data.images:
-        if os.path.abspath(bpy.path.abspath(img.filepath)) == abs_path:
-            return img
+    if index is None:
+        index = _build_image_index()
+    img = index.get(abs_path)
+    if img is not None:
+        return img
     img = bpy.data.images.load(path)
+    index[abs_path] = img
     # Set alpha to None for non-color data if needed, but defaults are usually safe
     return img
 
@@ -84,6 +123,7 @@ def get_or_create_material(name: str) -> bpy.types.Material:
         principled.inputs["Metallic"].default_value = DEFAULT_METALLIC
         
         mat.node_tree.links.new(principled.outputs["BSDF"], output.inputs["Surface"])
+        _BSDF_CACHE[mat.name_full] = [principled, 0]
         
     return mat
 
@@ -91,20 +131,28 @@ def get_or_create_material(name: str) -> bpy.types.Material:
 def setup_texture_node(material: bpy.types.Material, image: bpy.types.Image, slot_suffix: str):
     nodes = material.node_tree.nodes
     links = material.node_tree.links
-    principled = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+    entry = _BSDF_CACHE.get(material.name_full)
+    if entry is None:
+        # Material predates this build: scan its tree once, then reuse
+        principled = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        tex_count = sum(1 for n in nodes if n.type == 'TEX_IMAGE')
+        entry = _BSDF_CACHE[material.name_full] = [principled, tex_count]
+    principled = entry[0]
     if not principled:
         return
 
     tex_node = nodes.new("ShaderNodeTexImage")
     tex_node.image = image
-    tex_node.location = (-300, -200 * len([n for n in nodes if n.type == 'TEX_IMAGE']))
+    entry[1] += 1
+    tex_node.location = (-300, -200 * entry[1])
     
     # Simple Slot Logic
     if slot_suffix == "_MainTex":
         links.new(tex_node.outputs["Color"], principled.inputs["Base Color"])
-        # If image has alpha, link to Alpha?
-        if image.depth == 32 or (image.is_dirty or image.has_data): # checking depth is tricky without loading
-            # Just link alpha for safety if it looks like it might have it
+        # Decide on alpha from the extension: reading image.depth/has_data
+        # would force Blender to decode the file from disk
+        ext = os.path.splitext(image.filepath)[1].lower()
+        if ext in _ALPHA_EXTENSIONS:
             links.new(tex_node.outputs["Alpha"], principled.inputs["Alpha"])
             material.blend_method = 'HASHED' # or BLEND
 
@@ -138,24 +186,29 @@ def build_materials_from_textures(directory: str) -> Dict[str, bpy.types.Materia
     """Scans dir for Name__Slot.ext and builds materials."""
     materials = {}
     
-    # Regex to parse Name__Slot.ext
-    # Matches: material_name + "__" + slot_name + extension
-    pattern = re.compile(r"(.+)__(.+)\.(\w+)")
+    # One scandir pass: file type comes from the dirent, full path from entry.path
+    with os.scandir(directory) as it:
+        entries = [
+            e for e in it
+            if e.is_file() and os.path.splitext(e.name)[1].lower() in _EXT_SET
+        ]
+    entries.sort(key=lambda e: e.name)
     
-    for filename in sorted(os.listdir(directory)):
-        if not filename.lower().endswith(IMAGE_EXTENSIONS):
-            continue
-            
-        match = pattern.match(filename)
+    # Index loaded images once instead of rescanning bpy.data.images per texture
+    image_index = _build_image_index()
+    # Node references from a previous run may point at freed data
+    _BSDF_CACHE.clear()
+    
+    for entry in entries:
+        match = _NAME_SLOT_RE.match(entry.name)
         if not match:
-            print(f"Skipping non-conforming texture: {filename}")
+            print(f"Skipping non-conforming texture: {entry.name}")
             continue
             
         mat_name = match.group(1)
         slot_suffix = "_" + match.group(2) # e.g. _MainTex
         
-        path = os.path.join(directory, filename)
-        image = load_image(path)
+        image = load_image(entry.path, image_index)
         
         mat = get_or_create_material(mat_name)
         setup_texture_node(mat, image, slot_suffix)
@@ -168,6 +221,9 @@ def load_scene_mapping() -> Dict[str, str]:
     path = resolve_repo_path(MAPPING_FILE)
     if os.path.exists(path):
         try:
+            if orjson is not None:
+                with open(path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(path, 'r') as f:
                 return json.load(f)
         except Exception as e:
@@ -181,22 +237,49 @@ def iter_objects(objs: Optional[Iterable[bpy.types.Object]] = None):
     return objs
 
 
+@lru_cache(maxsize=None)
 def normalize_name(name):
     """Simplifies name to base identifier (e.g. 'VIFS006_0' -> 'VIFS006')."""
     # Split by common separators and take the first chunk
     # This handles "VIFS006-sharedassets" -> "VIFS006"
     # And "VIFS006_0" -> "VIFS006"
-    import re
     # Remove extension if present
     name = os.path.splitext(name)[0]
     # Split by - or _ and take first part if it looks like an ID
     # Pattern: match VIFS\d+
-    match = re.match(r"(VIFS\d+)", name, re.IGNORECASE)
+    match = _VIFS_RE.match(name)
     if match:
         return match.group(1).upper()
     
     # Fallback for others: split by separators
-    return re.split(r"[-_.]", name)[0]
+    return _SEP_RE.split(name, maxsplit=1)[0]
+
+def build_prefix_index(scene_mapping: Dict[str, str]) -> Tuple[Dict[str, str], list]:
+    """Index mapping filenames by their extension-less base for prefix lookups.
+
+    Returns the base->material dict plus the distinct base lengths, longest
+    first, so a lookup is one dict probe per length instead of a scan over
+    every mapping entry.
+    """
+    prefix_map: Dict[str, str] = {}
+    for filename, mat_name in scene_mapping.items():
+        prefix_map.setdefault(os.path.splitext(filename)[0], mat_name)
+    lengths = sorted({len(base) for base in prefix_map}, reverse=True)
+    return prefix_map, lengths
+
+
+def match_prefix(name: str, prefix_index: Tuple[Dict[str, str], list]) -> Optional[str]:
+    """Return the material for the longest mapping base that prefixes ``name``."""
+    prefix_map, lengths = prefix_index
+    name_len = len(name)
+    for length in lengths:
+        if length > name_len:
+            continue
+        mat_name = prefix_map.get(name[:length])
+        if mat_name is not None:
+            return mat_name
+    return None
+
 
 def main(objects: Optional[Iterable[bpy.types.Object]] = None) -> None:
     texture_dir = resolve_repo_path(TEXTURE_DIR)
@@ -211,33 +294,31 @@ def main(objects: Optional[Iterable[bpy.types.Object]] = None) -> None:
     # 2. Load Mapping
     scene_mapping = load_scene_mapping()
     
+    prefix_index = build_prefix_index(scene_mapping)
+
     # Pre-calculate normalized mapping keys
-    normalized_mapping = {}
-    for filename, mat_name in scene_mapping.items():
-        norm_key = normalize_name(filename)
-        normalized_mapping[norm_key] = mat_name
+    normalized_mapping = {
+        normalize_name(filename): mat_name for filename, mat_name in scene_mapping.items()
+    }
         
-    print(f"Debug: Mapped keys sample: {list(normalized_mapping.keys())[:5]}")
+    # Filter to meshes once so the assign loop needs no per-object type check
+    mesh_objs = [o for o in iter_objects(objects) if o.type == 'MESH']
 
-    # Debug: Print sample object names from scene to check against keys
-    scene_mesh_names = [o.name for o in iter_objects(objects) if o.type == 'MESH'][:5]
-    print(f"Debug: Scene object names sample: {scene_mesh_names}")
+    if DEBUG:
+        print(f"Debug: Mapped keys sample: {list(islice(normalized_mapping, 5))}")
 
     # 3. Assign
     assigned_count = 0
-    for obj in iter_objects(objects):
-        if obj.type != "MESH":
-            continue
-            
-        target_mat_name = None
-        obj_norm = normalize_name(obj.name) # Calculate this early for debug
+    # Debug: sample object names from scene, collected during the assign pass
+    scene_mesh_names = []
+    for obj in mesh_objs:
+        name = obj.name
+        if DEBUG and len(scene_mesh_names) < 5:
+            scene_mesh_names.append(name)
+        obj_norm = normalize_name(name) # Calculate this early for debug
         
-        # A. Exact/Prefix match with scene mapping (Existing logic)
-        for filename, mat_name in scene_mapping.items():
-            base_filename = os.path.splitext(filename)[0]
-            if obj.name.startswith(base_filename):
-                target_mat_name = mat_name
-                break
+        # A. Exact/Prefix match with scene mapping
+        target_mat_name = match_prefix(name, prefix_index)
         
         # B. Fuzzy Match (NEW)
         if not target_mat_name:
@@ -245,24 +326,34 @@ def main(objects: Optional[Iterable[bpy.types.Object]] = None) -> None:
                 target_mat_name = normalized_mapping[obj_norm]
         
         # C. Fallback: If object name *is* the material name
-        if not target_mat_name and obj.name in available_materials:
-            target_mat_name = obj.name
+        if not target_mat_name and name in available_materials:
+            target_mat_name = name
             
         # Debug why it failed for first few
         if not target_mat_name and assigned_count < 3:
-            print(f"Debug: Object '{obj.name}' (norm: '{obj_norm}') failed to match. Available norms example: 'VIFS006'")
+            print(f"Debug: Object '{name}' (norm: '{obj_norm}') failed to match. Available norms example: 'VIFS006'")
 
         # Apply
         if target_mat_name and target_mat_name in available_materials:
-            if obj.data.materials:
-                obj.data.materials.clear()
-            obj.data.materials.append(available_materials[target_mat_name])
+            mesh = obj.data
+            slots = mesh.materials
+            mat = available_materials[target_mat_name]
+            if not slots:
+                slots.append(mat)
+            elif slots[0] != mat:
+                # Overwrite the first slot in place instead of clear() + append()
+                slots[0] = mat
+            # Drop any extra slots so the mesh ends up single-material
+            for _ in range(len(slots) - 1):
+                slots.pop(index=len(slots) - 1)
             assigned_count += 1
         else:
             if target_mat_name:
                 pass # Squelch spam
                 # print(f"Object {obj.name} wants material '{target_mat_name}' but it was not created.")
 
+    if DEBUG:
+        print(f"Debug: Scene object names sample: {scene_mesh_names}")
     print(f"Assigned materials to {assigned_count} objects.")
 
 
@@ -1,53 +1,84 @@
 import bpy
 import json
+from bisect import bisect_left
 import os
 import math
+import numpy as np
 from mathutils import Vector, Quaternion, Matrix
 import coordinate_converter
 
+try:
+    from . import paths
+except ImportError:
+    import paths
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default path relative to project root
 HIERARCHY_PATH = "assets/scene_hierarchy.json"
 
+# Skip Empties for childless, mesh-less entries with an identity transform
+# (Unity grouping leftovers). They only add depsgraph nodes.
+PRUNE_LEAF_EMPTIES = True
+IDENTITY_TOLERANCE = 1e-6
+
 def resolve_path(path):
     """Resolve path relative to the project root."""
-    if os.path.isabs(path):
-        return path
-    
-    # This script is in blender/addon_superprism/
-    # Project root is two levels up: ../../
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    
-    # Check if we are in a hardcoded location as a fallback
-    fallback_root = r"C:\Users\Shadow\Desktop\Superpristm-to-Blender-main"
-    if not os.path.exists(os.path.join(project_root, "assets")):
-        if os.path.exists(fallback_root):
-            project_root = fallback_root
+    return paths.resolve_path(path)
 
-    return os.path.join(project_root, path)
+def index_mesh_objects(collection):
+    """
+    Index the collection once so lookups don't rescan it for every entry.
+    Returns (name -> object, sorted names) for exact and prefix matching.
+    """
+    objects = {obj.name: obj for obj in collection.objects}
+    return objects, sorted(objects)
 
-def find_mesh_object(mesh_asset_name, collection):
+def find_mesh_object(mesh_asset_name, index):
     """
-    Finds an object in the collection that matches the mesh asset name.
+    Finds an object in the index that matches the mesh asset name.
     Matches by checking if object name starts with the asset name (minus extension).
     """
     if not mesh_asset_name:
         return None
         
+    objects, sorted_names = index
     base_name = os.path.splitext(mesh_asset_name)[0]
     
     # 1. Try exact match in dictionary
-    if base_name in collection.objects:
-        return collection.objects[base_name]
+    obj = objects.get(base_name)
+    if obj is not None:
+        return obj
         
     # 2. Try fuzzy match (startswith)
     # This is useful if Blender appended .001, or if the imported name varies slightly
-    for obj in collection.objects:
-        if obj.name.startswith(base_name):
-            return obj
+    # Names sharing a prefix sort directly after it, so one bisect is enough.
+    i = bisect_left(sorted_names, base_name)
+    if i < len(sorted_names) and sorted_names[i].startswith(base_name):
+        return objects[sorted_names[i]]
             
     return None
 
+def load_hierarchy(abs_path):
+    """Load the hierarchy JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(abs_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(abs_path, 'r') as f:
+        return json.load(f)
+
+def is_identity_transform(pos, rot, scale, tol=IDENTITY_TOLERANCE):
+    """True if a Unity local transform (pos, quat x/y/z/w, scale) does nothing."""
+    return (
+        all(abs(v) <= tol for v in pos)
+        and all(abs(v) <= tol for v in rot[:3])
+        and abs(abs(rot[3]) - 1.0) <= tol
+        and all(abs(v - 1.0) <= tol for v in scale)
+    )
+
 def build_hierarchy(json_path=HIERARCHY_PATH):
     print(f"[construct_scene] Loading hierarchy from {json_path}")
     
@@ -56,8 +87,31 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
         print(f"[construct_scene] Error: File not found at {abs_path}")
         return
 
-    with open(abs_path, 'r') as f:
-        data = json.load(f)
+    data = load_hierarchy(abs_path)
+
+    # Pull the fields out once into flat columns so both passes iterate
+    # plain tuples instead of re-indexing every entry dict.
+    ids = [entry['id'] for entry in data]
+    names = [entry['name'] for entry in data]
+    mesh_assets = [entry['mesh_asset'] for entry in data]
+    parent_ids = [entry['parent_id'] for entry in data]
+    positions = [entry['position'] for entry in data]
+    rotations = [entry['rotation'] for entry in data]
+    scales = [entry['scale'] for entry in data]
+
+    if PRUNE_LEAF_EMPTIES:
+        has_children = set(parent_ids)
+        keep = [
+            obj_id in has_children or mesh_asset or not is_identity_transform(pos, rot, scale)
+            for obj_id, mesh_asset, pos, rot, scale in zip(ids, mesh_assets, positions, rotations, scales)
+        ]
+        pruned = keep.count(False)
+        if pruned:
+            ids, names, mesh_assets, parent_ids, positions, rotations, scales = (
+                [v for v, k in zip(column, keep) if k]
+                for column in (ids, names, mesh_assets, parent_ids, positions, rotations, scales)
+            )
+            print(f"[construct_scene] Pruned {pruned} empty leaf nodes.")
         
     # Source collection (where import_map put things)
     source_col_name = "MAP"
@@ -67,6 +121,8 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
         print(f"[construct_scene] Warning: Collection '{source_col_name}' not found. Using Scene Collection.")
         source_col = bpy.context.scene.collection
 
+    mesh_index = index_mesh_objects(source_col)
+
     # Target Collection for constructed scene
     target_col_name = "SuperPrism_Scene"
     target_col = bpy.data.collections.get(target_col_name)
@@ -77,25 +133,29 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
     # Track which source objects have been used
     # If a mesh is used multiple times, we must duplicate it for subsequent uses
     claimed_objects = set()
+    # mesh_asset -> mesh datablock of the claimed original, shared by later references
+    mesh_by_asset = {}
     
     # Map ID -> Created/Found Object
     id_to_obj = {}
+    # Created/Found Object per entry, aligned with the column lists
+    entry_objs = []
     
     # --- Pass 1: Create/Find Objects ---
-    print(f"[construct_scene] Processing {len(data)} objects...")
+    print(f"[construct_scene] Processing {len(ids)} objects...")
     
-    for entry in data:
-        obj_id = entry['id']
-        name = entry['name']
-        mesh_asset = entry['mesh_asset']
-        
+    for obj_id, name, mesh_asset in zip(ids, names, mesh_assets):
         blender_obj = None
         
         if mesh_asset:
-            candidate = find_mesh_object(mesh_asset, source_col)
+            candidate = find_mesh_object(mesh_asset, mesh_index)
             
             if candidate:
-                if candidate in claimed_objects:
+                if mesh_asset in mesh_by_asset:
+                    # Mesh already used, instance the same mesh data in a fresh object
+                    blender_obj = bpy.data.objects.new(name, mesh_by_asset[mesh_asset])
+                    target_col.objects.link(blender_obj)
+                elif candidate in claimed_objects:
                     # Object already used, make a duplicate (Linked Duplicate to share mesh data)
                     new_obj = candidate.copy()
                     # Link to target collection
@@ -105,11 +165,16 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
                     # First use, claim the original
                     blender_obj = candidate
                     claimed_objects.add(candidate)
+                    if candidate.type == 'MESH':
+                        mesh_by_asset[mesh_asset] = candidate.data
                     
                     # Move to target collection if not already there
-                    # Unlink from source (MAP) and link to target
-                    for col in blender_obj.users_collection:
-                        col.objects.unlink(blender_obj)
+                    # Unlink from source (MAP) and link to target. import_map only links
+                    # into source_col, so skip scanning users_collection.
+                    try:
+                        source_col.objects.unlink(blender_obj)
+                    except RuntimeError:
+                        pass  # Not in source_col (already moved)
                     target_col.objects.link(blender_obj)
                 
                 blender_obj.name = name
@@ -128,6 +193,7 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
             target_col.objects.link(blender_obj)
         
         id_to_obj[obj_id] = blender_obj
+        entry_objs.append(blender_obj)
 
     # --- Pass 2: Hierarchy & Transforms ---
     count_parented = 0
@@ -137,46 +203,37 @@ def build_hierarchy(json_path=HIERARCHY_PATH):
     q_z = Quaternion((0.0, 0.0, 1.0), math.radians(180))
     global_correction = q_x @ q_z
     
-    for entry in data:
-        obj_id = entry['id']
-        obj = id_to_obj.get(obj_id)
-        if not obj: continue
-        
+    # Convert every transform in a few array ops instead of one converter call per entry
+    locs_b = coordinate_converter.unity_positions_to_blender(positions)
+    rots_b = coordinate_converter.unity_rotations_to_blender(rotations)
+    scas_b = coordinate_converter.unity_scales_to_blender(scales)
+    
+    # Apply global correction to ROOT transforms as one matrix multiply
+    is_root = np.array([not parent_id for parent_id in parent_ids], dtype=bool)
+    correction_mat = np.array(global_correction.to_matrix(), dtype=np.float32)
+    locs_b[is_root] = locs_b[is_root] @ correction_mat.T
+    rot_mats = coordinate_converter.quaternions_to_matrices(rots_b)
+    rot_mats[is_root] = correction_mat @ rot_mats[is_root]
+    
+    # One local matrix per entry so each object needs a single RNA write
+    local_mats = coordinate_converter.compose_transform_matrices(locs_b, rot_mats, scas_b)
+    
+    # Local aliases for the tight loop below
+    get_obj = id_to_obj.get
+    _Matrix = Matrix
+    
+    for obj, parent_id, local_mat in zip(entry_objs, parent_ids, local_mats):
         # 1. Parenting
-        parent_id = entry['parent_id']
-        if parent_id and parent_id in id_to_obj:
-            parent_obj = id_to_obj[parent_id]
-            # Set parent without inverse correction (we will set local transform next)
-            obj.parent = parent_obj
-            count_parented += 1
+        if parent_id:
+            parent_obj = get_obj(parent_id)
+            if parent_obj is not None:
+                # Set parent without inverse correction (we will set local transform next)
+                obj.parent = parent_obj
+                count_parented += 1
             
         # 2. Transforms
-        # Unity data is local to parent
-        pos = entry['position']
-        rot = entry['rotation']
-        scale = entry['scale']
-        
-        # Convert to Blender Coords
-        # Unity: (x, y, z) -> Blender: (x, z, y) usually
-        # But we use the converter
-        loc_b = coordinate_converter.unity_pos_to_blender(pos)
-        rot_b = coordinate_converter.unity_rot_to_blender(rot)
-        sca_b = coordinate_converter.unity_scale_to_blender(scale)
-        
-        if not parent_id:
-            # Apply global correction to ROOT objects only
-            # Rotate position
-            obj.location = global_correction @ loc_b
-            # Rotate rotation
-            obj.rotation_mode = 'QUATERNION'
-            obj.rotation_quaternion = global_correction @ rot_b
-        else:
-            # Child objects are local to parent, no correction needed
-            obj.location = loc_b
-            obj.rotation_mode = 'QUATERNION'
-            obj.rotation_quaternion = rot_b
-        
-        obj.scale = sca_b
+        # Unity data is local to parent, already converted (and root-corrected) above
+        obj.matrix_local = _Matrix(local_mat)
 
     print(f"[construct_scene] Built hierarchy with {count_parented} parent relationships.")
     
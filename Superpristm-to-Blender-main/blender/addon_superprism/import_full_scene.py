@@ -28,36 +28,33 @@ APPLY_MATERIALS = True
 CREATE_HIERARCHY = True
 IMPORT_LIGHTS = True
 SETUP_VIEWPORT = True
+# Re-import submodules on every run; only while editing the scripts (set SUPERPRISM_DEV=1)
+DEV_RELOAD = __debug__ and bool(os.environ.get("SUPERPRISM_DEV"))
 # ---------------------
 
-def clear_scene():
-    if bpy.ops.object.mode_set.poll():
-        bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # Select all and delete
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
-    
-    # Clear collections (except Scene Collection)
-    for col in bpy.data.collections:
-        # Don't delete the collection if it has children in a way that causes issues, 
-        # but for our case we want a full wipe.
-        bpy.data.collections.remove(col)
-        
-    # Purge orphans
-    for i in range(2):
-        bpy.ops.outliner.orphans_purge()
-
-def main():
-    print("=== Starting Full Scene Import (Addon Mode) ===")
-    
-    # Force reload modules to pick up changes
+def _reload_all():
+    """Dev helper: pick up edits to the pipeline modules without restarting Blender."""
     importlib.reload(import_map)
     importlib.reload(auto_materials)
     importlib.reload(construct_scene)
     importlib.reload(import_lights)
     importlib.reload(viewport_setup)
 
+def clear_scene():
+    # Remove at the data level: works in any mode, no selection or context checks.
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    
+    # Clear collections (except Scene Collection)
+    # Always remove the head so we never mutate the view being iterated
+    collections = bpy.data.collections
+    while collections:
+        collections.remove(collections[0])
+        
+    import_map.purge_orphans()
+
+def run_steps():
+    """Run the enabled pipeline steps in order."""
     # 0. Cleanup
     print("\n--- Step 0: Cleaning Scene ---")
     clear_scene()
@@ -101,7 +98,24 @@ def main():
             viewport_setup.main()
         except Exception as e:
             print(f"Viewport setup failed: {e}")
-            
+
+def main():
+    print("=== Starting Full Scene Import (Addon Mode) ===")
+    
+    if DEV_RELOAD:
+        _reload_all()
+
+    # Bulk import: suspend undo pushes for the whole run and evaluate the
+    # depsgraph once at the end instead of after every step.
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        run_steps()
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+        bpy.context.view_layer.update()
+
     print("\n=== Import Complete ===")
 
 if __name__ == "__main__":
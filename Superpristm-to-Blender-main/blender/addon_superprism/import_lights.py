@@ -3,15 +3,23 @@
 import json
 import os
 import bpy
-import math
-from mathutils import Matrix
+from math import radians
+from functools import lru_cache
+import numpy as np
+from mathutils import Matrix, Quaternion
 
 # Import local modules
 # (In Blender text editor, these might need sys.path hacks, but assuming relative import works or file is run in context)
 try:
-    from . import coordinate_converter
+    from . import coordinate_converter, paths
 except ImportError:
     import coordinate_converter
+    import paths
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # -----------------------------
 # CONFIGURATION
@@ -24,19 +32,25 @@ INTENSITY_FACTOR = 10.0  # Unity 1.0 -> Blender Watts/Power (approx)
 RANGE_FACTOR = 1.0       # Units should be similar (Meters)
 # -----------------------------
 
+# Global fix (matches construct_scene.py v12): rotate by X(90) then Z(180).
+# Built once here rather than per light.
+_GLOBAL_CORRECTION = (
+    Quaternion((1.0, 0.0, 0.0), radians(90.0))
+    @ Quaternion((0.0, 0.0, 1.0), radians(180.0))
+)
+_GLOBAL_CORRECTION_NP = np.array(_GLOBAL_CORRECTION.to_matrix(), dtype=np.float32)
+
+@lru_cache(maxsize=64)
+def _resolve(path: str, base: str) -> str:
+    return os.path.abspath(os.path.join(base, path))
+
+
 def resolve_repo_path(path: str) -> str:
+    """Resolve ``path`` relative to the repo root."""
     if os.path.isabs(path):
         return path
-    
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    
-    fallback_root = r"C:\Users\Shadow\Desktop\Superpristm-to-Blender-main"
-    if not os.path.exists(os.path.join(project_root, "assets")):
-        if os.path.exists(fallback_root):
-            project_root = fallback_root
-            
-    return os.path.abspath(os.path.join(project_root, path))
+    return _resolve(path, paths.PROJECT_ROOT)
+
 
 def ensure_collection(name):
     col = bpy.data.collections.get(name)
@@ -45,6 +59,27 @@ def ensure_collection(name):
         bpy.context.scene.collection.children.link(col)
     return col
 
+def load_lights(abs_path):
+    """Load the lights JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(abs_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(abs_path, 'r') as f:
+        return json.load(f)
+
+def light_world_matrices(lights):
+    """Convert every light transform to an (N, 4, 4) corrected world matrix at once."""
+    positions = [l.get('position', [0, 0, 0]) for l in lights]
+    rotations = [l.get('rotation', [0, 0, 0, 1]) for l in lights] # x,y,z,w
+    
+    # --- GLOBAL CORRECTION (Matches construct_scene.py v12) ---
+    # Applied to position and rotation; scale stays at 1 as before
+    locs = coordinate_converter.unity_positions_to_blender(positions) @ _GLOBAL_CORRECTION_NP.T
+    rot_mats = _GLOBAL_CORRECTION_NP @ coordinate_converter.quaternions_to_matrices(
+        coordinate_converter.unity_rotations_to_blender(rotations)
+    )
+    return coordinate_converter.compose_transform_matrices(locs, rot_mats, np.ones_like(locs))
+
 def create_blender_light(light_data):
     """Create a Blender light object from Unity data."""
     
@@ -112,44 +147,14 @@ def create_blender_light(light_data):
     if blender_type == 'SPOT':
         # Unity angle is total cone angle (degrees)
         # Blender size is total cone angle (radians)
-        light_data_block.spot_size = math.radians(u_spot_angle)
+        light_data_block.spot_size = radians(u_spot_angle)
         light_data_block.spot_blend = 0.15 # Default blend
 
     # Create Object
     light_obj = bpy.data.objects.new(name=name, object_data=light_data_block)
     
-    # Transform
-    pos = light_data.get('position', [0,0,0])
-    rot = light_data.get('rotation', [0,0,0,1]) # x,y,z,w
-    scale = light_data.get('scale', [1,1,1])
-    
-    # Use Converter
-    loc = coordinate_converter.unity_pos_to_blender(pos)
-    q = coordinate_converter.unity_rot_to_blender(rot)
-    
-    # --- GLOBAL CORRECTION (Matches construct_scene.py v12) ---
-    q_x = math.radians(90.0)
-    q_z = math.radians(180.0)
-    # Construct quaternions (Blender Quaternion is w,x,y,z)
-    # Euler to Quat helper:
-    from mathutils import Quaternion, Euler
-    
-    # Global fix: Rotate by X(90) then Z(180)
-    # We apply this to the computed position and rotation
-    
-    # Create correction quaternion
-    # q_correction = q_x @ q_z (Order matters)
-    quat_x = Quaternion((1.0, 0.0, 0.0), q_x)
-    quat_z = Quaternion((0.0, 0.0, 1.0), q_z)
-    global_correction = quat_x @ quat_z 
-    
-    # Apply to Position
-    light_obj.location = global_correction @ loc
-    
-    # Apply to Rotation
+    # Transform is written in bulk by main() via light_world_matrices()
     light_obj.rotation_mode = 'QUATERNION'
-    light_obj.rotation_quaternion = global_correction @ q
-    # ----------------------------------------------------------
     
     # Corrections
     if blender_type == 'SUN':
@@ -164,8 +169,7 @@ def main():
         print(f"Lights JSON not found: {json_path}")
         return
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    data = load_lights(json_path)
         
     collection = ensure_collection(COLLECTION_NAME)
     
@@ -173,13 +177,19 @@ def main():
     for obj in list(collection.objects):
         bpy.data.objects.remove(obj, do_unlink=True)
         
-    count = 0
-    for l_data in data.get('lights', []):
-        obj = create_blender_light(l_data)
-        collection.objects.link(obj)
-        count += 1
+    lights = data.get('lights', [])
+    light_objs = [create_blender_light(l_data) for l_data in lights]
+    
+    # One batched conversion for all lights, then a single matrix write each
+    _Matrix = Matrix
+    for obj, world_mat in zip(light_objs, light_world_matrices(lights)):
+        obj.matrix_world = _Matrix(world_mat)
+    
+    link = collection.objects.link
+    for obj in light_objs:
+        link(obj)
         
-    print(f"Imported {count} lights.")
+    print(f"Imported {len(light_objs)} lights.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,32 @@
+"""Project root resolution shared by the import scripts.
+
+The root is detected once at import time so path resolution in the hot
+load paths is a plain string join with no filesystem calls.
+"""
+
+import os
+
+FALLBACK_ROOT = r"C:\Users\Shadow\Desktop\Superpristm-to-Blender-main"
+
+
+def _detect_project_root() -> str:
+    # This script is in blender/addon_superprism/
+    # Project root is two levels up: ../../
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(script_dir))
+
+    # Check if we are in a hardcoded location as a fallback
+    if not os.path.exists(os.path.join(project_root, "assets")):
+        if os.path.exists(FALLBACK_ROOT):
+            project_root = FALLBACK_ROOT
+    return project_root
+
+
+PROJECT_ROOT = _detect_project_root()
+
+
+def resolve_path(path: str) -> str:
+    """Resolve ``path`` relative to the project root."""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(PROJECT_ROOT, path)
@@ -10,6 +10,7 @@ Scale: (x, y, z) -> (x, z, y)
 """
 
 import math
+import numpy as np
 from mathutils import Vector, Quaternion, Matrix
 
 def unity_pos_to_blender(pos):
@@ -38,11 +39,60 @@ def unity_scale_to_blender(scale):
     x, y, z = scale
     return Vector((x, z, y))
 
+def unity_positions_to_blender(positions):
+    """Convert a batch of Unity positions to an (N, 3) Blender array."""
+    return np.asarray(positions, dtype=np.float32).reshape(-1, 3)[:, [0, 2, 1]]
+
+def unity_rotations_to_blender(rotations):
+    """Convert a batch of Unity quaternions (x, y, z, w) to an (N, 4) Blender (w, x, y, z) array."""
+    # Same mapping as unity_rot_to_blender: (-uw, ux, uz, uy)
+    quats = np.asarray(rotations, dtype=np.float32).reshape(-1, 4)[:, [3, 0, 2, 1]]
+    quats[:, 0] *= -1.0
+    return quats
+
+def unity_scales_to_blender(scales):
+    """Convert a batch of Unity scales to an (N, 3) Blender array."""
+    return np.asarray(scales, dtype=np.float32).reshape(-1, 3)[:, [0, 2, 1]]
+
+def quaternions_to_matrices(quats):
+    """Convert an (N, 4) array of Blender (w, x, y, z) quaternions to (N, 3, 3) rotation matrices."""
+    quats = np.asarray(quats, dtype=np.float32).reshape(-1, 4)
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    w, x, y, z = (quats / norms).T
+    
+    mats = np.empty((len(quats), 3, 3), dtype=np.float32)
+    mats[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    mats[:, 0, 1] = 2.0 * (x * y - w * z)
+    mats[:, 0, 2] = 2.0 * (x * z + w * y)
+    mats[:, 1, 0] = 2.0 * (x * y + w * z)
+    mats[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    mats[:, 1, 2] = 2.0 * (y * z - w * x)
+    mats[:, 2, 0] = 2.0 * (x * z - w * y)
+    mats[:, 2, 1] = 2.0 * (y * z + w * x)
+    mats[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return mats
+
+def compose_transform_matrices(locs, rot_mats, scales):
+    """Build (N, 4, 4) matrices from locations, rotation matrices and scales (batched LocRotScale)."""
+    locs = np.asarray(locs, dtype=np.float32).reshape(-1, 3)
+    mats = np.zeros((len(locs), 4, 4), dtype=np.float32)
+    # Scaling the columns of R is R @ diag(scale)
+    mats[:, :3, :3] = rot_mats * np.asarray(scales, dtype=np.float32).reshape(-1, 1, 3)
+    mats[:, :3, 3] = locs
+    mats[:, 3, 3] = 1.0
+    return mats
+
+def convert_transforms_np(positions, rotations, scales):
+    """Convert batches of Unity transforms to (N, 4, 4) Blender matrices in one pass."""
+    rot_mats = quaternions_to_matrices(unity_rotations_to_blender(rotations))
+    return compose_transform_matrices(
+        unity_positions_to_blender(positions),
+        rot_mats,
+        unity_scales_to_blender(scales),
+    )
+
 def convert_transform_matrix(pos, rot, scale):
     """Build a Blender matrix from Unity transform data."""
-    loc = unity_pos_to_blender(pos)
-    qua = unity_rot_to_blender(rot)
-    sca = unity_scale_to_blender(scale)
-    
-    mat = Matrix.LocRotScale(loc, qua, sca)
-    return mat
+    # Single-row call into the batched path so both give identical results
+    return Matrix(convert_transforms_np([pos], [rot], [scale])[0].tolist())
@@ -11,6 +11,7 @@ import bpy
 import os
 import sys
 import importlib.util
+import traceback
 
 # --- PATH SETUP ---
 # Hardcoded root to ensure absolute certainty in Blender
@@ -24,12 +25,22 @@ print(f"INFO: Blender Dir: {BLENDER_DIR}")
 if BLENDER_DIR not in sys.path:
     sys.path.append(BLENDER_DIR)
 
+# Re-execute the pipeline modules on every run; only while editing the scripts (set SUPERPRISM_DEV=1)
+DEV_RELOAD = bool(os.environ.get("SUPERPRISM_DEV"))
+
 # --- DYNAMIC IMPORT HELPER ---
 def load_module_from_path(module_name, file_path):
     """Loads a python module from a specific file path."""
     if not os.path.exists(file_path):
         print(f"ERROR: Could not find module file: {file_path}")
         return None
+    
+    # Reuse the already executed module (and its warm caches) unless developing
+    cached = sys.modules.get(module_name)
+    if not DEV_RELOAD and cached is not None:
+        cached_file = getattr(cached, "__file__", None)
+        if cached_file and os.path.abspath(cached_file) == os.path.abspath(file_path):
+            return cached
         
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     if spec and spec.loader:
@@ -48,14 +59,7 @@ auto_materials = load_module_from_path("auto_materials", os.path.join(BLENDER_DI
 construct_scene = load_module_from_path("construct_scene", os.path.join(BLENDER_DIR, "construct_scene.py"))
 import_lights = load_module_from_path("import_lights", os.path.join(BLENDER_DIR, "import_lights.py"))
 viewport_setup = load_module_from_path("viewport_setup", os.path.join(BLENDER_DIR, "viewport_setup.py"))
-
-# Force Reload (Crucial for Blender development)
-import importlib
-if import_map: importlib.reload(import_map)
-if auto_materials: importlib.reload(auto_materials)
-if construct_scene: importlib.reload(construct_scene)
-if import_lights: importlib.reload(import_lights)
-if viewport_setup: importlib.reload(viewport_setup)
+# No explicit reload: load_module_from_path re-executes the files when DEV_RELOAD is set.
 
 # --- Configuration ---
 IMPORT_MESHES = True
@@ -66,26 +70,20 @@ SETUP_VIEWPORT = True
 # ---------------------
 
 def clear_scene():
-    if bpy.ops.object.mode_set.poll():
-        bpy.ops.object.mode_set(mode='OBJECT')
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    # Remove at the data level: works in any mode, no selection or context checks.
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
     
     # Clear collections
-    for col in bpy.data.collections:
-        bpy.data.collections.remove(col)
+    # Always remove the head so we never mutate the view being iterated
+    collections = bpy.data.collections
+    while collections:
+        collections.remove(collections[0])
         
-    # Purge orphans
-    for i in range(3):
-        bpy.ops.outliner.orphans_purge()
-
-def main():
-    print("=== Starting Full Scene Import (v18 - Brighter Lights) ===")
-    
-    if not (import_map and auto_materials and construct_scene and import_lights and viewport_setup):
-        print("CRITICAL ERROR: One or more modules failed to load. Aborting.")
-        return
+    import_map.purge_orphans()
 
+def run_steps():
+    """Run the enabled pipeline steps in order."""
     # 0. Cleanup
     print("\n--- Step 0: Cleaning Scene ---")
     clear_scene()
@@ -97,7 +95,6 @@ def main():
             import_map.main()
         except Exception as e:
             print(f"Mesh import failed: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print("\n--- Step 1: Skipped (IMPORT_MESHES=False) ---")
@@ -109,7 +106,6 @@ def main():
             auto_materials.main()
         except Exception as e:
             print(f"Material setup failed: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print("\n--- Step 2: Skipped (APPLY_MATERIALS=False) ---")
@@ -121,7 +117,6 @@ def main():
             construct_scene.main()
         except Exception as e:
             print(f"Scene construction failed: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print("\n--- Step 3: Skipped (CREATE_HIERARCHY=False) ---")
@@ -133,7 +128,6 @@ def main():
             import_lights.main()
         except Exception as e:
             print(f"Light import failed: {e}")
-            import traceback
             traceback.print_exc()
     else:
         print("\n--- Step 4: Skipped (IMPORT_LIGHTS=False) ---")
@@ -145,7 +139,25 @@ def main():
             viewport_setup.main()
         except Exception as e:
             print(f"Viewport setup failed: {e}")
-            
+
+def main():
+    print("=== Starting Full Scene Import (v18 - Brighter Lights) ===")
+    
+    if not (import_map and auto_materials and construct_scene and import_lights and viewport_setup):
+        print("CRITICAL ERROR: One or more modules failed to load. Aborting.")
+        return
+
+    # Bulk import: suspend undo pushes for the whole run and evaluate the
+    # depsgraph once at the end instead of after every step.
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        run_steps()
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
+        bpy.context.view_layer.update()
+
     print("\n=== Import Complete ===")
 
 if __name__ == "__main__":
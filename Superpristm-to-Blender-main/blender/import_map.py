@@ -9,7 +9,14 @@ creating duplicates.
 import os
 from math import radians
 
+import bmesh
 import bpy
+from mathutils import Matrix
+
+try:
+    from . import paths
+except ImportError:
+    import paths
 
 # -----------------------------
 # CONFIGURATION
@@ -20,9 +27,15 @@ GLOBAL_SCALE = 1.0
 ROTATE_X_DEGREES = 90.0  # Unity -> Blender upright fix
 APPLY_TRANSFORMS = True  # Apply rotation/scale after import
 SHADE_SMOOTH = False
+RECALC_NORMALS = False  # Recalculate outside normals with bmesh (slower; for inconsistent source winding)
 COLLECTION_NAME = "MAP"
+# Purge every orphan type in the file (node groups, actions, worlds, ...) when clearing
+# the collection, not just the meshes, materials and images left behind by the import
+PURGE_ALL_ORPHANS = False
 # -----------------------------
 
+_IMPORT_EXTENSIONS = tuple(ext.lower() for ext in IMPORT_EXTENSIONS)
+
 
 def resolve_repo_path(path: str) -> str:
     """Resolve ``path`` relative to the .blend when saved, else repo root."""
@@ -33,8 +46,7 @@ def resolve_repo_path(path: str) -> str:
     if bpy.data.filepath:
         base = os.path.dirname(bpy.data.filepath)
     else:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        base = os.path.abspath(os.path.join(script_dir, os.pardir))
+        base = paths.PROJECT_ROOT
 
     resolved = os.path.abspath(os.path.join(base, path))
     print(f"[import_map] Resolved path: {resolved}")
@@ -50,21 +62,35 @@ def ensure_collection(name: str) -> bpy.types.Collection:
     return collection
 
 
-def clear_collection(collection: bpy.types.Collection) -> None:
+def purge_orphans() -> None:
+    """Purge all orphan data-blocks, preferring the direct data API."""
+    try:
+        # Recursive purge reaches the fixpoint in one call
+        bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=True, do_recursive=True)
+    except (AttributeError, TypeError):
+        # Older Blender: no data-level purge (or no do_recursive), use the operator
+        for _ in range(3):
+            bpy.ops.outliner.orphans_purge()
+
+
+def clear_collection(
+    collection: bpy.types.Collection, purge_all: bool = PURGE_ALL_ORPHANS
+) -> None:
     """Remove all objects inside the collection and clean orphaned data."""
 
     for obj in list(collection.objects):
         bpy.data.objects.remove(obj, do_unlink=True)
 
-    for mesh in list(bpy.data.meshes):
-        if mesh.users == 0:
-            bpy.data.meshes.remove(mesh)
-    for image in list(bpy.data.images):
-        if image.users == 0:
-            bpy.data.images.remove(image)
-    for material in list(bpy.data.materials):
-        if material.users == 0:
-            bpy.data.materials.remove(material)
+    if purge_all:
+        purge_orphans()
+        return
+
+    # Meshes before materials before images: each sweep catches what the previous
+    # one orphaned, so a single pass covers the import's data-blocks.
+    for datablocks in (bpy.data.meshes, bpy.data.materials, bpy.data.images):
+        for block in list(datablocks):
+            if block.users == 0:
+                datablocks.remove(block)
 
 
 def link_to_collection(obj: bpy.types.Object, collection: bpy.types.Collection) -> None:
@@ -76,7 +102,8 @@ def link_to_collection(obj: bpy.types.Object, collection: bpy.types.Collection)
 
 def import_mesh(filepath: str):
     """Import a single mesh file and return the newly created objects."""
-    before = set(bpy.context.scene.objects)
+    # Diff on datablock pointers; scanning the scene graph each file is O(N^2).
+    before = {o.as_pointer() for o in bpy.data.objects}
     ext = os.path.splitext(filepath)[1].lower()
 
     if ext == ".obj":
@@ -91,44 +118,110 @@ def import_mesh(filepath: str):
     else:
         raise RuntimeError(f"Unsupported file type: {filepath}")
 
-    after = set(bpy.context.scene.objects)
-    return list(after - before)
+    return [o for o in bpy.data.objects if o.as_pointer() not in before]
+
+
+def recalc_normals(meshes) -> None:
+    """Make face normals consistent (outside) for every mesh, without edit mode.
+
+    Data-level equivalent of ``bpy.ops.mesh.normals_make_consistent``; a single
+    BMesh is reused for all meshes.
+    """
+    bm = bmesh.new()
+    try:
+        for mesh in meshes:
+            bm.from_mesh(mesh)
+            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+            bm.to_mesh(mesh)
+            bm.clear()
+            mesh.update()
+    finally:
+        bm.free()
 
 
 def apply_orientation(objs: list[bpy.types.Object]) -> None:
-    """Rotate imported objects and optionally apply transforms."""
-    rot_x = radians(90.0)
-    
+    """Rotate OBJ-imported objects and optionally bake the fix into the mesh data.
+
+    Works on the mesh datablocks directly instead of ``transform_apply`` so no
+    selection, mode switches or per-call depsgraph updates are involved. This
+    relies on the OBJ importer leaving every object unparented with identity
+    rotation and scale; FBX imports go through :func:`apply_fbx_orientation`.
+    """
+    rot_x = radians(ROTATE_X_DEGREES)
+
+    # Shared mesh data must only be transformed once. RNA wrappers are recreated
+    # on access, so key on the underlying pointer rather than id().
+    meshes = {}
     for obj in objs:
-        # 1. Rotate X 90 (Stand upright)
+        if obj.type == "MESH":
+            meshes[obj.data.as_pointer()] = obj.data
+
+    if APPLY_TRANSFORMS:
+        # Rotate X 90 (stand upright), then Scale Y -1: (x, -z, y) -> (x, z, y).
+        # The negative scale fixes the "twisted" / mirrored geometry.
+        orientation = Matrix.Rotation(rot_x, 4, "X") @ Matrix.Scale(-1.0, 4, (0.0, 1.0, 0.0))
+
+        for mesh in meshes.values():
+            mesh.transform(orientation)
+            if not RECALC_NORMALS:
+                # The mirror (det < 0) inverts the winding order, flip it back.
+                mesh.flip_normals()
+            mesh.update()
+
+        if RECALC_NORMALS:
+            recalc_normals(meshes.values())
+
+        for obj in objs:
+            if obj.type == "MESH":
+                obj.rotation_euler = (0.0, 0.0, 0.0)
+                obj.scale = (1.0, 1.0, 1.0)
+            else:
+                obj.rotation_euler.rotate_axis("X", rot_x)
+    else:
+        for obj in objs:
+            obj.rotation_euler.rotate_axis("X", rot_x)
+
+    for mesh in meshes.values():
+        # One buffer write instead of a Python -> RNA call per polygon.
+        mesh.polygons.foreach_set("use_smooth", [SHADE_SMOOTH] * len(mesh.polygons))
+
+
+def apply_fbx_orientation(objs: list[bpy.types.Object]) -> None:
+    """Rotate FBX-imported objects and optionally apply transforms.
+
+    The FBX importer puts its axis conversion and unit scale on the objects and
+    on parent empties, so the full rotation and scale are applied with
+    ``transform_apply``. Only hierarchy roots get the fix; children inherit it.
+    """
+    if not objs:
+        return
+    rot_x = radians(ROTATE_X_DEGREES)
+
+    imported = {obj.as_pointer() for obj in objs}
+    for obj in objs:
+        if obj.parent is not None and obj.parent.as_pointer() in imported:
+            continue
+        # Rotate X 90 (stand upright), then Scale Y -1, as in apply_orientation
         obj.rotation_euler.rotate_axis("X", rot_x)
-        
-    if APPLY_TRANSFORMS and objs:
-        
-        # 2. Scale Y -1: (x, -z, y) -> (x, z, y)
-        # This fixes the "twisted" / mirrored geometry
-        obj.scale.y *= -1
-
-    if APPLY_TRANSFORMS and objs:
+        if APPLY_TRANSFORMS:
+            obj.scale.y *= -1
+
+    meshes = {}
+    for obj in objs:
+        if obj.type == "MESH":
+            meshes[obj.data.as_pointer()] = obj.data
+
+    if APPLY_TRANSFORMS:
         bpy.ops.object.select_all(action="DESELECT")
         for obj in objs:
             obj.select_set(True)
         bpy.context.view_layer.objects.active = objs[0]
-        # Apply Rotation AND Scale
         bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-        
-        # After negative scale, normals might be flipped. Recalculate.
-        if objs:
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.normals_make_consistent(inside=False)
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-    if objs:
-        for obj in objs:
-            if obj.type == "MESH":
-                for poly in obj.data.polygons:
-                    poly.use_smooth = SHADE_SMOOTH
+        # The mirror inverts the winding order; make the normals face outside again.
+        recalc_normals(meshes.values())
+
+    for mesh in meshes.values():
+        mesh.polygons.foreach_set("use_smooth", [SHADE_SMOOTH] * len(mesh.polygons))
 
 
 def main() -> None:
@@ -139,23 +232,31 @@ def main() -> None:
     collection = ensure_collection(COLLECTION_NAME)
     clear_collection(collection)
 
-    obj_files = sorted(
-        f for f in os.listdir(mesh_dir) if f.lower().endswith(IMPORT_EXTENSIONS)
-    )
+    # scandir entries carry the file type, so no extra stat per entry
+    with os.scandir(mesh_dir) as entries:
+        obj_files = sorted(
+            e.name for e in entries
+            if e.is_file() and e.name.lower().endswith(_IMPORT_EXTENSIONS)
+        )
     if not obj_files:
         raise RuntimeError(
             f"No files with extensions {IMPORT_EXTENSIONS} found in: {mesh_dir}"
         )
 
-    imported_objects: list[bpy.types.Object] = []
+    obj_objects: list[bpy.types.Object] = []
+    fbx_objects: list[bpy.types.Object] = []
     for filename in obj_files:
         filepath = os.path.join(mesh_dir, filename)
-        new_objects = import_mesh(filepath)
-        for obj in new_objects:
-            link_to_collection(obj, collection)
-        imported_objects.extend(new_objects)
+        target = fbx_objects if filename.lower().endswith(".fbx") else obj_objects
+        target.extend(import_mesh(filepath))
+    imported_objects = obj_objects + fbx_objects
+
+    # Relink once all files are in so the outliner is only rebuilt at the end.
+    for obj in imported_objects:
+        link_to_collection(obj, collection)
 
-    apply_orientation(imported_objects)
+    apply_orientation(obj_objects)
+    apply_fbx_orientation(fbx_objects)
     print(
         f"Imported {len(imported_objects)} objects into collection '{COLLECTION_NAME}' from {mesh_dir}"
     )
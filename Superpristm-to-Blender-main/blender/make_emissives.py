@@ -18,15 +18,22 @@ EMISSION_COLOR_GREEN = (0.25, 1.0, 0.35, 1.0)
 EMISSION_COLOR_YELLOW = (1.0, 0.9, 0.25, 1.0)
 EMISSIVE_GREEN_NAME = "EMISSIVE_GREEN"
 EMISSIVE_YELLOW_NAME = "EMISSIVE_YELLOW"
-TARGET_KEYWORDS = {
-    "green": ("green",),
-    "yellow": ("yellow",),
-}
+GREEN_KEYWORD = "green"
+YELLOW_KEYWORD = "yellow"
 # -----------------------------
 
 
 def build_emission_material(name: str, color: tuple[float, float, float, float], strength: float) -> bpy.types.Material:
-    material = bpy.data.materials.get(name) or bpy.data.materials.new(name=name)
+    material = bpy.data.materials.get(name)
+    if material and material.use_nodes:
+        # Re-run: update the existing emission node instead of rebuilding the tree
+        emission = next((n for n in material.node_tree.nodes if n.type == "EMISSION"), None)
+        if emission:
+            emission.inputs["Color"].default_value = color
+            emission.inputs["Strength"].default_value = strength
+            return material
+
+    material = material or bpy.data.materials.new(name=name)
     material.use_nodes = True
     nodes = material.node_tree
     nodes.nodes.clear()
@@ -45,27 +52,18 @@ def build_emission_material(name: str, color: tuple[float, float, float, float],
     return material
 
 
-def choose_emission(obj_name: str, green_mat: bpy.types.Material, yellow_mat: bpy.types.Material):
-    lower = obj_name.lower()
-    if any(k in lower for k in TARGET_KEYWORDS["green"]):
-        return green_mat
-    if any(k in lower for k in TARGET_KEYWORDS["yellow"]):
-        return yellow_mat
-    return None
-
-
 def assign_material(obj: bpy.types.Object, material: bpy.types.Material) -> None:
-    if obj.type != "MESH":
-        return
+    """Replace the materials of a mesh object (see iter_objects for the filter)."""
     if obj.data.materials:
         obj.data.materials.clear()
     obj.data.materials.append(material)
 
 
-def iter_objects(objs: Optional[Iterable[bpy.types.Object]] = None):
+def iter_objects(objs: Optional[Iterable[bpy.types.Object]] = None) -> list[bpy.types.Object]:
+    """Return only the mesh objects; lights, cameras and empties never get emission."""
     if objs is None:
-        return bpy.data.objects
-    return objs
+        objs = bpy.data.objects
+    return [obj for obj in objs if obj.type == "MESH"]
 
 
 def main(objects: Optional[Iterable[bpy.types.Object]] = None) -> None:
@@ -78,12 +76,15 @@ def main(objects: Optional[Iterable[bpy.types.Object]] = None) -> None:
 
     assigned = 0
     for obj in iter_objects(objects):
-        if obj.type != "MESH":
+        lower = obj.name.lower()
+        if GREEN_KEYWORD in lower:
+            emission_mat = green_mat
+        elif YELLOW_KEYWORD in lower:
+            emission_mat = yellow_mat
+        else:
             continue
-        emission_mat = choose_emission(obj.name, green_mat, yellow_mat)
-        if emission_mat:
-            assign_material(obj, emission_mat)
-            assigned += 1
+        assign_material(obj, emission_mat)
+        assigned += 1
 
     print(
         f"Applied emissive materials to {assigned} objects (keywords: green/yellow)."
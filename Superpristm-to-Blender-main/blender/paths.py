@@ -0,0 +1,23 @@
+"""Project root resolution shared by the import scripts.
+
+The root is detected once at import time so path resolution in the hot
+load paths is a plain string join with no filesystem calls.
+"""
+
+import os
+
+
+def _detect_project_root() -> str:
+    # This script is in blender/ folder, the project root is one level up
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(script_dir)
+
+
+PROJECT_ROOT = _detect_project_root()
+
+
+def resolve_path(path: str) -> str:
+    """Resolve ``path`` relative to the project root."""
+    if os.path.isabs(path):
+        return path
+    return os.path.join(PROJECT_ROOT, path)
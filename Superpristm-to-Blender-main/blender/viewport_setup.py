@@ -3,41 +3,42 @@ import bpy
 def setup_viewport():
     """Configures the viewport for optimal viewing of the imported scene."""
     print("[viewport_setup] Configuring viewport and render settings...")
+    scene = bpy.context.scene
     
     # 1. Set Render Engine to EEVEE (Good balance for game assets)
-    if bpy.context.scene.render.engine != 'BLENDER_EEVEE':
-        bpy.context.scene.render.engine = 'BLENDER_EEVEE'
+    if scene.render.engine != 'BLENDER_EEVEE':
+        scene.render.engine = 'BLENDER_EEVEE'
         
     # 2. Enable Ambient Occlusion and Bloom for better visuals
-    if hasattr(bpy.context.scene, 'eevee'):
+    if hasattr(scene, 'eevee'):
         # Blender < 4.2 uses 'use_gtao', 4.2+ uses 'ray_tracing' or different structure
         try:
-            bpy.context.scene.eevee.use_gtao = True # Ambient Occlusion (Legacy)
+            scene.eevee.use_gtao = True # Ambient Occlusion (Legacy)
         except AttributeError:
             pass # Property likely removed in this version
             
         try:
-            bpy.context.scene.eevee.use_bloom = True
+            scene.eevee.use_bloom = True
         except AttributeError:
             pass
             
     # 3. Set Viewport Shading to MATERIAL or RENDERED
     # We need to find a 3D View area to change its setting
+    # A VIEW_3D area's active space is always the 3D view, no need to walk area.spaces
     for area in bpy.context.screen.areas:
         if area.type == 'VIEW_3D':
-            for space in area.spaces:
-                if space.type == 'VIEW_3D':
-                    # Set to Material Preview
-                    space.shading.type = 'MATERIAL'
-                    # Optional: Enable scene lights/world in preview if desired
-                    # space.shading.use_scene_lights = True
-                    # space.shading.use_scene_world = True
+            space = area.spaces.active
+            # Set to Material Preview
+            space.shading.type = 'MATERIAL'
+            # Optional: Enable scene lights/world in preview if desired
+            # space.shading.use_scene_lights = True
+            # space.shading.use_scene_world = True
                     
     # 4. Set World Background (if not already set)
-    if bpy.context.scene.world is None:
-        bpy.context.scene.world = bpy.data.worlds.new("SuperPrismWorld")
+    if scene.world is None:
+        scene.world = bpy.data.worlds.new("SuperPrismWorld")
         
-    world = bpy.context.scene.world
+    world = scene.world
     if world and world.use_nodes:
         # Check if background is too dark
         bg = world.node_tree.nodes.get("Background")
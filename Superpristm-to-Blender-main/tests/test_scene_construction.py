@@ -3,6 +3,7 @@ import os
 import sys
 import json
 import importlib.util
+from mathutils import Vector
 
 # --- PATH SETUP ---
 # Hardcoded root based on your provided environment to ensure absolute certainty
@@ -112,8 +113,8 @@ def test_scene_construction():
             print("PASS: Parenting correct.")
             
         # Check Position
-        # Use the imported module
-        expected_loc = coordinate_converter.unity_pos_to_blender([10.0, 0.0, 5.0])
+        # Hard-coded: Unity (10, 0, 5) is Blender (10, 5, 0), independent of the converter
+        expected_loc = Vector((10.0, 5.0, 0.0))
         
         diff = (child.location - expected_loc).length
         if diff < 0.001:
@@ -1,56 +1,55 @@
 import os
 import shutil
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from guid_index import build_guid_map
+
 # Configuration
 SOURCE_ASSETS_DIR = r"C:\Users\Shadow\Desktop\UberUnity-main4.7\Assets"
 LOCAL_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LOCAL_MAT_DIR = os.path.join(LOCAL_PROJECT_DIR, "SuperPrismReactor", "Materials")
 TARGET_TEX_DIR = os.path.join(LOCAL_PROJECT_DIR, "assets", "textures")
 TARGET_MAT_JSON = os.path.join(LOCAL_PROJECT_DIR, "assets", "materials.json")
+GUID_CACHE = os.path.join(LOCAL_PROJECT_DIR, "assets", ".guid_cache.json")
 
 # Regex for parsing
 GUID_PATTERN = re.compile(r"guid: ([a-fA-F0-9]{32})")
 TEX_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.tga', '.psd', '.tif', '.tiff'}
+# Below this many materials, process start-up costs more than parsing inline
+PARALLEL_MIN_MATERIALS = 32
+# m_SavedProperties blocks that follow m_TexEnvs and never hold texture guids
+_END_OF_TEXTURES = ("m_Floats:", "m_Colors:")
 
-def build_guid_map(root_dir):
-    """Scans directory for .meta files and maps GUIDs to asset paths."""
-    print(f"Scanning for assets in {root_dir}...")
-    guid_map = {}
-    count = 0
-    
-    for root, _, files in os.walk(root_dir):
-        for file in files:
-            if file.endswith(".meta"):
-                meta_path = os.path.join(root, file)
-                asset_path = meta_path[:-5] # remove .meta
-                
-                if not os.path.exists(asset_path):
-                    continue
-                    
-                # Read GUID from meta file
-                try:
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        match = GUID_PATTERN.search(content)
-                        if match:
-                            guid = match.group(1)
-                            guid_map[guid] = asset_path
-                            count += 1
-                except Exception as e:
-                    print(f"Error reading {meta_path}: {e}")
-                    
-    print(f"Indexed {count} assets.")
-    return guid_map
+# Native Windows copy (server-side/block-clone aware, keeps timestamps)
+if os.name == 'nt':
+    import ctypes
+    _copy_file_ex = ctypes.windll.kernel32.CopyFileExW
+    _copy_file_ex.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                              ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    _copy_file_ex.restype = ctypes.c_int
+else:
+    _copy_file_ex = None
+
+def copy_texture(source_path, dest_path):
+    """Copies a texture through the OS copy path, keeping its modification time."""
+    if _copy_file_ex is not None:
+        if _copy_file_ex(source_path, dest_path, None, None, None, 0):
+            return
+        # Fall back to the portable copy if the native call fails
+        shutil.copy2(source_path, dest_path)
+        return
+    # copyfile uses os.sendfile on Linux and fcopyfile on macOS (no user-space buffer);
+    # only the times are carried over, copystat's chmod/xattr passes are skipped
+    shutil.copyfile(source_path, dest_path)
+    st = os.stat(source_path)
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
 
 def parse_material(mat_path):
     """Parses a .mat file to find texture GUIDs."""
     textures = {}
     try:
-        with open(mat_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         # Find _MainTex and similar properties
         # Simple regex approach for YAML
         # _MainTex: {fileID: 2800000, guid: 545f7e344c18d4445aa8ac2a794b28a2, type: 3}
@@ -58,20 +57,23 @@ def parse_material(mat_path):
         # We look for lines like " - _TextureName:" followed by "guid: ..."
         # This is a simplification; a full YAML parser is better but regex is faster for this specific task
         
-        # Split by lines to track context
-        lines = content.split('\n')
+        # Stream lines to track context; texture guids only live under m_TexEnvs,
+        # so stop once the float/color property blocks start
         current_prop = None
         
-        for line in lines:
-            line = line.strip()
-            if line.startswith("- _"):
-                current_prop = line.split(':')[0].replace("- ", "")
-            
-            if "guid:" in line and current_prop:
-                match = GUID_PATTERN.search(line)
-                if match:
-                    textures[current_prop] = match.group(1)
-                current_prop = None # Reset
+        with open(mat_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith(_END_OF_TEXTURES):
+                    break
+                if line.startswith("- _"):
+                    current_prop = line.split(':')[0].replace("- ", "")
+                
+                if "guid:" in line and current_prop:
+                    match = GUID_PATTERN.search(line)
+                    if match:
+                        textures[current_prop] = match.group(1)
+                    current_prop = None # Reset
                 
     except Exception as e:
         print(f"Error parsing material {mat_path}: {e}")
@@ -87,18 +89,28 @@ def main():
         os.makedirs(TARGET_TEX_DIR)
         
     # 1. Build Index
-    guid_map = build_guid_map(SOURCE_ASSETS_DIR)
+    print(f"Scanning for assets in {SOURCE_ASSETS_DIR}...")
+    guid_map = build_guid_map(SOURCE_ASSETS_DIR, recursive=True, require_asset=True, cache_path=GUID_CACHE)
+    print(f"Indexed {len(guid_map)} assets.")
     
     # 2. Process Local Materials
     print(f"Processing materials in {LOCAL_MAT_DIR}...")
     files = [f for f in os.listdir(LOCAL_MAT_DIR) if f.endswith(".mat")]
+    mat_paths = [os.path.join(LOCAL_MAT_DIR, f) for f in files]
     
-    for mat_file in files:
-        mat_path = os.path.join(LOCAL_MAT_DIR, mat_file)
+    # Parsing is independent per material; map() keeps results in file order
+    if len(mat_paths) >= PARALLEL_MIN_MATERIALS:
+        with ProcessPoolExecutor() as pool:
+            parsed = list(pool.map(parse_material, mat_paths, chunksize=16))
+    else:
+        parsed = [parse_material(path) for path in mat_paths]
+    
+    # One directory listing instead of an exists() stat per texture slot
+    existing = set(os.listdir(TARGET_TEX_DIR))
+    copy_jobs = []
+    for mat_file, textures in zip(files, parsed):
         print(f"Processing {mat_file}...")
         
-        textures = parse_material(mat_path)
-        
         for tex_slot, guid in textures.items():
             if guid in guid_map:
                 source_path = guid_map[guid]
@@ -109,14 +121,22 @@ def main():
                     dest_name = f"{os.path.splitext(mat_file)[0]}_{tex_slot}{ext}"
                     dest_path = os.path.join(TARGET_TEX_DIR, dest_name)
                     
-                    if not os.path.exists(dest_path):
+                    if dest_name not in existing:
                         print(f"  Copying {os.path.basename(source_path)} -> {dest_name}")
-                        shutil.copy2(source_path, dest_path)
+                        copy_jobs.append((source_path, dest_path))
+                        existing.add(dest_name)
                     else:
                         print(f"  Skipping {dest_name} (exists)")
             else:
                 print(f"  Warning: GUID {guid} not found for {tex_slot}")
 
+    # Copies are I/O bound and release the GIL, so threads overlap them
+    if copy_jobs:
+        with ThreadPoolExecutor() as pool:
+            futures = [pool.submit(copy_texture, src, dst) for src, dst in copy_jobs]
+        for future in futures:
+            future.result() # Re-raise copy errors
+
     print("Done.")
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import extract_lights
+import map_scene_materials
+import parse_scene_hierarchy
+from guid_index import build_guid_map
+from json_io import write_json
+
+# Same inputs as the individual tools
+SCENE_PATH = parse_scene_hierarchy.SCENE_PATH
+MESH_DIR = map_scene_materials.MESH_DIR
+MAT_DIR = map_scene_materials.MAT_DIR
+
+def read_scene(scene_path):
+    """Reads the scene once and returns its lines as bytes."""
+    with open(scene_path, 'rb') as f:
+        # Split on '\n' only, like iterating the file; the parsers strip each line
+        return f.read().split(b'\n')
+
+def main():
+    # The .meta scans are disk bound and independent: overlap them with the scene read
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        print("Building GUID maps...")
+        mesh_future = pool.submit(build_guid_map, MESH_DIR, ext_filter=[".obj", ".fbx"], names_only=True)
+        mat_future = pool.submit(build_guid_map, MAT_DIR, ext_filter=[".mat"], names_only=True)
+
+        print(f"Reading {SCENE_PATH}...")
+        lines = read_scene(SCENE_PATH)
+
+        mesh_guids = mesh_future.result()
+        mat_guids = mat_future.result()
+
+    # 1. Materials
+    mat_names = {k: os.path.splitext(v)[0] for k, v in mat_guids.items()}
+    objects = map_scene_materials.parse_scene_lines(lines)
+    mapping = map_scene_materials.resolve_links(objects, mesh_guids, mat_names)
+
+    output_dir = os.path.dirname(map_scene_materials.OUTPUT_JSON)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    write_json(map_scene_materials.OUTPUT_JSON, mapping)
+    print(f"Mapped {len(mapping)} meshes to materials -> {map_scene_materials.OUTPUT_JSON}")
+
+    # 2. Lights
+    lights = extract_lights.extract_lights(lines)
+    write_json(extract_lights.OUTPUT_JSON, {"lights": lights})
+    print(f"Extracted {len(lights)} lights -> {extract_lights.OUTPUT_JSON}")
+
+    # 3. Hierarchy
+    hierarchy = parse_scene_hierarchy.build_hierarchy(lines, mesh_guids)
+    write_json(parse_scene_hierarchy.OUTPUT_JSON, hierarchy)
+    print(f"Exported hierarchy of {len(hierarchy)} objects -> {parse_scene_hierarchy.OUTPUT_JSON}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import os
 import re
-import json
+
+from json_io import write_json
 
 # Configuration
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -8,56 +9,103 @@ SCENE_PATH = os.path.join(PROJECT_ROOT, "SuperPrismReactor", "SuperPRISM_Reactor
 OUTPUT_JSON = os.path.join(PROJECT_ROOT, "assets", "scene_lights.json")
 
 # Regex Patterns
-YAML_TAG_PATTERN = re.compile(r"^--- !u!(\d+) &(\d+)")
-FILE_ID_PATTERN = re.compile(r"fileID: (-?\d+)")
-GUID_PATTERN = re.compile(r"guid: ([a-fA-F0-9]{32})")
+YAML_TAG_PATTERN = re.compile(rb"^--- !u!(\d+) &(\d+)")
+FILE_ID_PATTERN = re.compile(rb"fileID: (-?\d+)")
+GUID_PATTERN = re.compile(rb"guid: ([a-fA-F0-9]{32})")
 
-def parse_vector3(line):
-    # {x: 0, y: 5, z: 0}
-    m = re.search(r"x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+)", line)
-    if m:
-        return [float(m.group(1)), float(m.group(2)), float(m.group(3))]
-    return [0.0, 0.0, 0.0]
+# Field value patterns, matched against the text after the key's colon
+_VEC_RE = re.compile(rb"\s*\{?x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+)(?:, w: ([\d\.-]+))?")
+_COLOR_RE = re.compile(rb"\s*\{?r: ([\d\.-]+), g: ([\d\.-]+), b: ([\d\.-]+), a: ([\d\.-]+)")
 
-def parse_quat(line):
-    # {x: 0, y: 0, z: 0, w: 1}
-    m = re.search(r"x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+), w: ([\d\.-]+)", line)
+def parse_vec(value, default):
+    # {x: 0, y: 5, z: 0} or {x: 0, y: 0, z: 0, w: 1}; the default fixes the arity
+    size = len(default)
+    try:
+        # Fast path for the rigid one-line layout: split once, no regex
+        parts = value.strip(b' {}').split(b', ')
+        if len(parts) == size:
+            return [float(p[3:]) for p in parts]
+    except ValueError:
+        pass # Unusual layout, fall back to the pattern
+    m = _VEC_RE.match(value)
     if m:
-        return [float(m.group(1)), float(m.group(2)), float(m.group(3)), float(m.group(4))]
-    return [0.0, 0.0, 0.0, 1.0]
+        values = m.groups()[:size]
+        if values[-1] is not None:
+            return [float(v) for v in values]
+    return list(default)
 
-def parse_color(line):
+def parse_color(value):
     # {r: 1, g: 1, b: 1, a: 1}
-    m = re.search(r"r: ([\d\.-]+), g: ([\d\.-]+), b: ([\d\.-]+), a: ([\d\.-]+)", line)
+    try:
+        # Fast path for the rigid one-line layout: split once, no regex
+        r, g, b, a = value.strip(b' {}').split(b', ')
+        return [float(r[3:]), float(g[3:]), float(b[3:]), float(a[3:])]
+    except ValueError:
+        pass # Unusual layout, fall back to the pattern
+    m = _COLOR_RE.match(value)
     if m:
-        return [float(m.group(1)), float(m.group(2)), float(m.group(3)), float(m.group(4))]
+        return [float(v) for v in m.groups()]
     return [1.0, 1.0, 1.0, 1.0]
 
-def parse_float(line, key):
-    # m_Intensity: 1
-    if key in line:
-        parts = line.split(f"{key}:")
-        if len(parts) > 1:
-            try:
-                return float(parts[1].strip())
-            except ValueError:
-                pass
-    return None
-
-def parse_int(line, key):
-    # m_Type: 2
-    if key in line:
-        parts = line.split(f"{key}:")
-        if len(parts) > 1:
-            try:
-                return int(parts[1].strip())
-            except ValueError:
-                pass
-    return None
+# Field handlers: each receives the raw bytes after the key's colon and the record being built
+def _set_vec(field, default):
+    def handler(value, data):
+        data[field] = parse_vec(value, default)
+    return handler
 
-def main():
-    print(f"Scanning {SCENE_PATH} for lights...")
-    
+def _set_parsed(field, parser):
+    def handler(value, data):
+        data[field] = parser(value)
+    return handler
+
+def _set_number(field, cast):
+    # m_Intensity: 1 / m_Type: 2 (keep the default on malformed values)
+    def handler(value, data):
+        try:
+            data[field] = cast(value.strip())
+        except ValueError:
+            pass
+    return handler
+
+def _set_file_id(field):
+    def handler(value, data):
+        fid = FILE_ID_PATTERN.search(value)
+        if fid: data[field] = fid.group(1).decode('ascii')
+    return handler
+
+def _set_name(value, data):
+    data['name'] = value.strip().decode('utf-8')
+
+def _add_component(value, data):
+    fid = FILE_ID_PATTERN.search(value)
+    if fid: data['components'].append(fid.group(1).decode('ascii'))
+
+# YAML type id -> {line key (text before the first colon) -> handler}
+FIELD_HANDLERS = {
+    1: { # GameObject
+        b"m_Name": _set_name,
+        b"- component": _add_component,
+    },
+    4: { # Transform
+        b"m_LocalPosition": _set_vec('pos', (0.0, 0.0, 0.0)),
+        b"m_LocalRotation": _set_vec('rot', (0.0, 0.0, 0.0, 1.0)),
+        b"m_LocalScale": _set_vec('scale', (0.0, 0.0, 0.0)),
+        b"m_Father": _set_file_id('father'),
+        b"m_GameObject": _set_file_id('game_object'),
+    },
+    108: { # Light
+        # Also hit by the nested m_Shadows.m_Type line, as before
+        b"m_Type": _set_number('type', int),
+        b"m_Color": _set_parsed('color', parse_color),
+        b"m_Intensity": _set_number('intensity', float),
+        b"m_Range": _set_number('range', float),
+        b"m_SpotAngle": _set_number('spot_angle', float),
+        b"m_GameObject": _set_file_id('game_object'),
+    },
+}
+
+def extract_lights(lines):
+    """Parses scene lines (bytes) and returns the light entries for the JSON output."""
     # Data structures
     # components: file_id -> {type, data}
     # game_objects: file_id -> {name, components: []}
@@ -70,14 +118,17 @@ def main():
     current_id = None
     current_type = None
     current_data = {}
+    handlers = None
+    
+    # Hot-loop callables bound once instead of looked up per line
+    match_tag = YAML_TAG_PATTERN.match
+    get_handlers = FIELD_HANDLERS.get
     
-    with open(SCENE_PATH, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        
     for line in lines:
         line = line.strip()
-        tag_match = YAML_TAG_PATTERN.match(line)
-        
+        # Only document headers can match; skip the regex for every other line
+        tag_match = match_tag(line) if line.startswith(b"--- ") else None
+    
         if tag_match:
             # Save previous
             if current_id:
@@ -87,12 +138,13 @@ def main():
                     transforms[current_id] = current_data
                 elif current_type == 108: # Light
                     components[current_id] = current_data
-            
+        
             # Start new
             current_type = int(tag_match.group(1))
-            current_id = tag_match.group(2)
+            current_id = tag_match.group(2).decode('ascii')
             current_data = {}
-            
+            handlers = get_handlers(current_type)
+        
             if current_type == 1:
                 current_data = {'name': 'Unknown', 'components': []}
             elif current_type == 4:
@@ -103,51 +155,16 @@ def main():
                     'range': 10.0, 'spot_angle': 30.0, 'shadow_type': 0, 'game_object': None
                 }
             continue
-            
+        
         if not current_id:
             continue
-            
-        # Parse fields
-        if current_type == 1: # GameObject
-            if line.startswith("m_Name:"):
-                current_data['name'] = line.split("m_Name:")[1].strip()
-            if line.startswith("- component:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['components'].append(fid.group(1))
-                
-        elif current_type == 4: # Transform
-            if line.startswith("m_LocalPosition:"): current_data['pos'] = parse_vector3(line)
-            if line.startswith("m_LocalRotation:"): current_data['rot'] = parse_quat(line)
-            if line.startswith("m_LocalScale:"): current_data['scale'] = parse_vector3(line)
-            if line.startswith("m_Father:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['father'] = fid.group(1)
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
-
-        elif current_type == 108: # Light
-            if line.startswith("m_Type:"): 
-                val = parse_int(line, "m_Type")
-                if val is not None: current_data['type'] = val
-            if line.startswith("m_Color:"): current_data['color'] = parse_color(line)
-            if line.startswith("m_Intensity:"): 
-                val = parse_float(line, "m_Intensity")
-                if val is not None: current_data['intensity'] = val
-            if line.startswith("m_Range:"):
-                val = parse_float(line, "m_Range")
-                if val is not None: current_data['range'] = val
-            if line.startswith("m_SpotAngle:"):
-                val = parse_float(line, "m_SpotAngle")
-                if val is not None: current_data['spot_angle'] = val
-            if line.startswith("m_Shadows:"):
-                # Handle nested structure roughly or look for key
-                pass
-            if "m_Type:" in line and "m_Shadows" in line: # Fallback if single line
-                 pass
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
+        
+        # Parse fields: one partition + one dict lookup per line
+        if handlers:
+            key, sep, value = line.partition(b':')
+            if sep:
+                handler = handlers.get(key)
+                if handler: handler(value, current_data)
 
     # Save last
     if current_id:
@@ -194,10 +211,18 @@ def main():
         
         extracted_lights.append(light_entry)
         
+    return extracted_lights
+
+def main():
+    print(f"Scanning {SCENE_PATH} for lights...")
+    
+    # Stream the scene as bytes: every parsed field is ASCII, so only names get decoded
+    with open(SCENE_PATH, 'rb', buffering=1024 * 1024) as f:
+        extracted_lights = extract_lights(f)
+        
     output_data = {"lights": extracted_lights}
     
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(output_data, f, indent=2)
+    write_json(OUTPUT_JSON, output_data)
         
     print(f"Extracted {len(extracted_lights)} lights to {OUTPUT_JSON}")
 
@@ -0,0 +1,112 @@
+import json
+import os
+import re
+
+# The guid line sits right below fileFormatVersion, so the head of the file is enough
+GUID_BYTES_PATTERN = re.compile(rb"guid: ([a-fA-F0-9]{32})")
+META_HEAD_BYTES = 512
+
+# O_BINARY only exists (and matters) on Windows
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+def read_guid(meta_path):
+    """Returns the GUID stored in a .meta file, or None."""
+    # Raw descriptor read: no buffered file object for a single small read
+    fd = os.open(meta_path, _READ_FLAGS)
+    try:
+        head = os.read(fd, META_HEAD_BYTES)
+        match = GUID_BYTES_PATTERN.search(head)
+        if match is None and len(head) == META_HEAD_BYTES:
+            # Unusual layout: fall back to the rest of the file
+            with os.fdopen(fd, 'rb', closefd=False) as f:
+                match = GUID_BYTES_PATTERN.search(head + f.read())
+    finally:
+        os.close(fd)
+    return match.group(1).decode('ascii') if match else None
+
+def _load_cache(cache_path):
+    # meta path -> (mtime_ns, guid); a missing or corrupt cache just means a full read
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return {path: tuple(entry) for path, entry in json.load(f).items()}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache_path, cache, root, seen):
+    # Entries under root are replaced by this scan (drops deleted .meta files)
+    prefix = os.path.join(root, "")
+    merged = {path: entry for path, entry in cache.items() if not path.startswith(prefix)}
+    merged.update(seen)
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(merged))
+    except OSError as e:
+        print(f"Could not write GUID cache {cache_path}: {e}")
+
+def build_guid_map(root, ext_filter=None, recursive=False, require_asset=False, names_only=False,
+                   cache_path=None):
+    """Scans root for .meta files and maps GUIDs to asset paths.
+
+    ext_filter limits the assets to the given suffixes, recursive descends into
+    subdirectories, require_asset skips .meta files whose asset is missing and
+    names_only maps to the bare asset filename instead of its full path.
+    With cache_path, GUIDs are remembered per .meta file and only files whose
+    mtime changed since the last run are read again.
+    """
+    guid_map = {}
+    if not os.path.isdir(root):
+        return guid_map
+    suffixes = tuple(ext_filter) if ext_filter else None
+    cache = _load_cache(cache_path) if cache_path else None
+    seen = {}
+    dirty = False
+
+    # Manual scandir stack: one listing per directory, file types come from the dirents
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+            continue
+
+        # Sibling names answer "does the asset exist" without a stat per .meta
+        names = {entry.name for entry in entries} if require_asset else None
+
+        for entry in entries:
+            name = entry.name
+            if name.endswith(".meta"):
+                asset_name = name[:-5] # remove .meta
+                if suffixes and not asset_name.endswith(suffixes):
+                    continue
+                if names is not None and asset_name not in names:
+                    continue
+                try:
+                    if cache is None:
+                        guid = read_guid(entry.path)
+                    else:
+                        mtime = entry.stat().st_mtime_ns
+                        cached = cache.get(entry.path)
+                        if cached is not None and cached[0] == mtime:
+                            guid = cached[1]
+                        else:
+                            guid = read_guid(entry.path)
+                            dirty = True
+                        seen[entry.path] = (mtime, guid)
+                except OSError as e:
+                    print(f"Error reading {entry.path}: {e}")
+                    continue
+                if guid:
+                    guid_map[guid] = asset_name if names_only else entry.path[:-5]
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+
+    if cache is not None:
+        prefix = os.path.join(root, "")
+        # Also rewrite when .meta files under root disappeared since the last run
+        if dirty or sum(1 for path in cache if path.startswith(prefix)) != len(seen):
+            _save_cache(cache_path, cache, root, seen)
+
+    return guid_map
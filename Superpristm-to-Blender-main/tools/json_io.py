@@ -0,0 +1,16 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json(path, data):
+    """Writes data as 2-space indented JSON in a single write call."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # json.dump issues one write per token; serialize first, write once
+    with open(path, 'w') as f:
+        f.write(json.dumps(data, indent=2))
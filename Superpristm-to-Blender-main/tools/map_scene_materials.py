@@ -1,6 +1,8 @@
 import os
 import re
-import json
+
+from guid_index import build_guid_map
+from json_io import write_json
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SCENE_PATH = os.path.join(PROJECT_ROOT, "SuperPrismReactor", "SuperPRISM_Reactor.unity")
@@ -9,30 +11,51 @@ MAT_DIR = os.path.join(PROJECT_ROOT, "SuperPrismReactor", "Materials")
 OUTPUT_JSON = os.path.join(PROJECT_ROOT, "assets", "scene_materials.json")
 
 # Regex
-GUID_PATTERN = re.compile(r"guid: ([a-fA-F0-9]{32})")
-FILE_ID_PATTERN = re.compile(r"fileID: (-?\d+)")
-YAML_TAG_PATTERN = re.compile(r"^--- !u!(\d+) &(\d+)")
+GUID_PATTERN = re.compile(rb"guid: ([a-fA-F0-9]{32})")
+FILE_ID_PATTERN = re.compile(rb"fileID: (-?\d+)")
+YAML_TAG_PATTERN = re.compile(rb"^--- !u!(\d+) &(\d+)")
 
-def build_guid_map(directory, ext_filter=None):
-    guid_map = {} # guid -> filename
-    if not os.path.exists(directory):
-        return guid_map
-        
-    for f in os.listdir(directory):
-        if f.endswith(".meta"):
-            asset_file = f[:-5]
-            if ext_filter and not any(asset_file.endswith(e) for e in ext_filter):
-                continue
-                
-            path = os.path.join(directory, f)
-            with open(path, 'r', encoding='utf-8') as meta:
-                content = meta.read()
-                match = GUID_PATTERN.search(content)
-                if match:
-                    guid_map[match.group(1)] = asset_file
-    return guid_map
+# Field handlers: each receives the raw bytes after the key's colon and the record being built
+def _set_match(field, pattern):
+    def handler(value, data):
+        m = pattern.search(value)
+        if m: data[field] = m.group(1).decode('ascii')
+    return handler
+
+def _append_match(field, pattern):
+    def handler(value, data):
+        m = pattern.search(value)
+        if m: data[field].append(m.group(1).decode('ascii'))
+    return handler
+
+# YAML type id -> {line key (text before the first colon) -> handler}
+FIELD_HANDLERS = {
+    1: { # GameObject
+        # - component: {fileID: 1688549749}
+        b"- component": _append_match('components', FILE_ID_PATTERN),
+    },
+    33: { # MeshFilter
+        b"m_GameObject": _set_match('game_object', FILE_ID_PATTERN),
+        b"m_Mesh": _set_match('mesh_guid', GUID_PATTERN),
+    },
+    23: { # MeshRenderer
+        b"m_GameObject": _set_match('game_object', FILE_ID_PATTERN),
+    },
+}
+
+# YAML type id -> (key that opens a block list, record field collecting its GUIDs)
+# m_Materials:
+# - {fileID: 2100000, guid: ...}
+LIST_FIELDS = {
+    23: (b"m_Materials", 'materials'), # MeshRenderer
+}
 
 def parse_scene(scene_path):
+    # Stream the scene as bytes: every parsed field is ASCII, so no line gets decoded
+    with open(scene_path, 'rb', buffering=1024 * 1024) as f:
+        return parse_scene_lines(f)
+
+def parse_scene_lines(lines):
     # We need to link MeshFilter(mesh) -> GameObject <- MeshRenderer(material)
     
     # 1. Parse all objects
@@ -42,57 +65,53 @@ def parse_scene(scene_path):
     current_id = None
     current_type = None
     current_data = {}
+    handlers = None
+    list_key = list_field = None
+    in_list = False
     
-    with open(scene_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        
     for line in lines:
         line = line.strip()
-        tag_match = YAML_TAG_PATTERN.match(line)
-        
+        # Only document headers can match; skip the regex for every other line
+        tag_match = YAML_TAG_PATTERN.match(line) if line.startswith(b"--- ") else None
+    
         if tag_match:
             # Save previous
             if current_id:
                 objects[current_id] = {'type': current_type, **current_data}
-            
+        
             # Start new
             current_type = int(tag_match.group(1))
-            current_id = tag_match.group(2)
+            current_id = tag_match.group(2).decode('ascii')
             current_data = {'components': [], 'materials': []}
+            handlers = FIELD_HANDLERS.get(current_type)
+            list_key, list_field = LIST_FIELDS.get(current_type, (None, None))
+            in_list = False
             continue
-            
+        
         if not current_id:
             continue
-            
-        # Parse fields based on type
-        # GameObject (1)
-        if current_type == 1:
-            if line.startswith("- component:"):
-                 # - component: {fileID: 1688549749}
-                 fid = FILE_ID_PATTERN.search(line)
-                 if fid:
-                     current_data['components'].append(fid.group(1))
-                     
-        # MeshFilter (33)
-        elif current_type == 33:
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
-            if line.startswith("m_Mesh:"):
-                guid = GUID_PATTERN.search(line)
-                if guid: current_data['mesh_guid'] = guid.group(1)
-
-        # MeshRenderer (23)
-        elif current_type == 23:
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
-            if "guid:" in line and ("m_Materials" in line or line.startswith("- ")): # very loose parsing for list
-                # Actually m_Materials is a list.
-                # m_Materials:
-                # - {fileID: 2100000, guid: ...}
-                guid = GUID_PATTERN.search(line)
-                if guid: current_data['materials'].append(guid.group(1))
+        
+        # Inside a block list every item is "- ..."; the first other line closes it
+        if in_list:
+            if line.startswith(b"- "):
+                m = GUID_PATTERN.search(line)
+                if m: current_data[list_field].append(m.group(1).decode('ascii'))
+                continue
+            in_list = False
+        
+        # Parse fields based on type: one partition + one dict lookup per line
+        if handlers:
+            key, sep, value = line.partition(b':')
+            if sep:
+                if key == list_key:
+                    # Flow style keeps the items on this line: "m_Materials: [{...}, {...}]"
+                    current_data[list_field].extend(
+                        guid.decode('ascii') for guid in GUID_PATTERN.findall(value)
+                    )
+                    in_list = not value.strip()
+                    continue
+                handler = handlers.get(key)
+                if handler: handler(value, current_data)
 
     # Save last
     if current_id:
@@ -138,8 +157,8 @@ def resolve_links(objects, mesh_guids, mat_guids):
 
 def main():
     print("Building GUID maps...")
-    mesh_guids = build_guid_map(MESH_DIR, ext_filter=[".obj", ".fbx"])
-    mat_guids = build_guid_map(MAT_DIR, ext_filter=[".mat"])
+    mesh_guids = build_guid_map(MESH_DIR, ext_filter=[".obj", ".fbx"], names_only=True)
+    mat_guids = build_guid_map(MAT_DIR, ext_filter=[".mat"], names_only=True)
     
     # We also need to map mat filename to material name (usually same minus ext)
     mat_names = {k: os.path.splitext(v)[0] for k, v in mat_guids.items()}
@@ -155,8 +174,7 @@ def main():
     if not os.path.exists(os.path.dirname(OUTPUT_JSON)):
         os.makedirs(os.path.dirname(OUTPUT_JSON))
         
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(mapping, f, indent=2)
+    write_json(OUTPUT_JSON, mapping)
     print(f"Saved to {OUTPUT_JSON}")
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import os
 import re
-import json
+
+from guid_index import build_guid_map
+from json_io import write_json
 
 # Configuration
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -9,72 +11,109 @@ MESH_DIR = os.path.join(PROJECT_ROOT, "SuperPrismReactor", "Mesh")
 OUTPUT_JSON = os.path.join(PROJECT_ROOT, "assets", "scene_hierarchy.json")
 
 # Regex Patterns
-YAML_TAG_PATTERN = re.compile(r"^--- !u!(\d+) &(\d+)")
-FILE_ID_PATTERN = re.compile(r"fileID: (-?\d+)")
-GUID_PATTERN = re.compile(r"guid: ([a-fA-F0-9]{32})")
+YAML_TAG_PATTERN = re.compile(rb"^--- !u!(\d+) &(\d+)")
+FILE_ID_PATTERN = re.compile(rb"fileID: (-?\d+)")
+GUID_PATTERN = re.compile(rb"guid: ([a-fA-F0-9]{32})")
 
-def parse_vector3(line):
-    m = re.search(r"x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+)", line)
-    if m: return [float(m.group(1)), float(m.group(2)), float(m.group(3))]
-    return [0.0, 0.0, 0.0]
+# Field value patterns, matched against the text after the key's colon
+_VEC_RE = re.compile(rb"\s*\{?x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+)(?:, w: ([\d\.-]+))?")
 
-def parse_quat(line):
-    m = re.search(r"x: ([\d\.-]+), y: ([\d\.-]+), z: ([\d\.-]+), w: ([\d\.-]+)", line)
-    if m: return [float(m.group(1)), float(m.group(2)), float(m.group(3)), float(m.group(4))]
-    return [0.0, 0.0, 0.0, 1.0]
+def parse_vec(value, default):
+    # {x: 0, y: 5, z: 0} or {x: 0, y: 0, z: 0, w: 1}; the default fixes the arity
+    size = len(default)
+    try:
+        # Fast path for the rigid one-line layout: split once, no regex
+        parts = value.strip(b' {}').split(b', ')
+        if len(parts) == size:
+            return [float(p[3:]) for p in parts]
+    except ValueError:
+        pass # Unusual layout, fall back to the pattern
+    m = _VEC_RE.match(value)
+    if m:
+        values = m.groups()[:size]
+        if values[-1] is not None:
+            return [float(v) for v in values]
+    return list(default)
 
-def build_guid_map(directory, ext_filter=None):
-    guid_map = {} # guid -> filename
-    if not os.path.exists(directory):
-        return guid_map
-        
-    for f in os.listdir(directory):
-        if f.endswith(".meta"):
-            asset_file = f[:-5]
-            if ext_filter and not any(asset_file.endswith(e) for e in ext_filter):
-                continue
-                
-            path = os.path.join(directory, f)
-            with open(path, 'r', encoding='utf-8') as meta:
-                content = meta.read()
-                match = GUID_PATTERN.search(content)
-                if match:
-                    guid_map[match.group(1)] = asset_file
-    return guid_map
+# Field handlers: each receives the raw bytes after the key's colon and the record being built
+def _set_vec(field, default):
+    def handler(value, data):
+        data[field] = parse_vec(value, default)
+    return handler
 
-def main():
-    print(f"Parsing hierarchy from {SCENE_PATH}...")
-    
-    # 0. Build Mesh GUID Map
-    print("Building Mesh GUID map...")
-    mesh_guid_map = build_guid_map(MESH_DIR, ext_filter=[".obj", ".fbx"])
-    
+def _set_match(field, pattern):
+    def handler(value, data):
+        m = pattern.search(value)
+        if m: data[field] = m.group(1).decode('ascii')
+    return handler
+
+def _set_name(value, data):
+    data['name'] = value.strip().decode('utf-8')
+
+# YAML type id -> {line key (text before the first colon) -> handler}
+FIELD_HANDLERS = {
+    1: { # GameObject
+        b"m_Name": _set_name,
+    },
+    4: { # Transform
+        b"m_LocalPosition": _set_vec('pos', (0.0, 0.0, 0.0)),
+        b"m_LocalRotation": _set_vec('rot', (0.0, 0.0, 0.0, 1.0)),
+        b"m_LocalScale": _set_vec('scale', (0.0, 0.0, 0.0)),
+        b"m_Father": _set_match('father', FILE_ID_PATTERN),
+        b"m_GameObject": _set_match('game_object', FILE_ID_PATTERN),
+    },
+    33: { # MeshFilter
+        b"m_Mesh": _set_match('mesh_guid', GUID_PATTERN),
+        b"m_GameObject": _set_match('game_object', FILE_ID_PATTERN),
+    },
+}
+
+def build_hierarchy(lines, mesh_guid_map):
+    """Parses scene lines (bytes) into the flat hierarchy list written to the JSON output."""
     # 1. Parse raw data
     game_objects = {} # id -> {name}
     transforms = {}   # id -> {father, pos, rot, scale, game_object_id}
-    mesh_filters = {} # id -> {mesh_guid, game_object_id}
+    
+    # GameObject lookups, filled as each record is finalized (no second pass)
+    go_to_trans_id = {}      # GameObject id -> Transform id
+    go_to_mesh_filename = {} # GameObject id -> mesh asset filename
+    
+    def finish_record(record_type, record_id, data):
+        if record_type == 1:
+            game_objects[record_id] = data
+        elif record_type == 4:
+            transforms[record_id] = data
+            if data['game_object']:
+                go_to_trans_id[data['game_object']] = record_id
+        elif record_type == 33: # MeshFilter: only needed for the GO -> mesh lookup
+            if data['game_object'] and data['mesh_guid']:
+                filename = mesh_guid_map.get(data['mesh_guid'])
+                if filename:
+                    go_to_mesh_filename[data['game_object']] = filename
     
     current_id = None
     current_type = None
     current_data = {}
+    handlers = None
+    
+    # Hot-loop callables bound once instead of looked up per line
+    match_tag = YAML_TAG_PATTERN.match
+    get_handlers = FIELD_HANDLERS.get
     
-    with open(SCENE_PATH, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-        
     for line in lines:
         line = line.strip()
-        tag_match = YAML_TAG_PATTERN.match(line)
-        
+        # Only document headers can match; skip the regex for every other line
+        tag_match = match_tag(line) if line.startswith(b"--- ") else None
+    
         if tag_match:
             if current_id:
-                if current_type == 1: game_objects[current_id] = current_data
-                elif current_type == 4: transforms[current_id] = current_data
-                elif current_type == 33: mesh_filters[current_id] = current_data
-            
+                finish_record(current_type, current_id, current_data)
+        
             current_type = int(tag_match.group(1))
-            current_id = tag_match.group(2)
+            current_id = tag_match.group(2).decode('ascii')
             current_data = {}
-            
+            handlers = get_handlers(current_type)
+        
             if current_type == 1:
                 current_data = {'name': 'Unknown'}
             elif current_type == 4:
@@ -82,54 +121,22 @@ def main():
             elif current_type == 33:
                 current_data = {'mesh_guid': None, 'game_object': None}
             continue
-            
-        if not current_id: continue
-        
-        if current_type == 1:
-            if line.startswith("m_Name:"):
-                current_data['name'] = line.split("m_Name:")[1].strip()
         
-        elif current_type == 4:
-            if line.startswith("m_LocalPosition:"): current_data['pos'] = parse_vector3(line)
-            if line.startswith("m_LocalRotation:"): current_data['rot'] = parse_quat(line)
-            if line.startswith("m_LocalScale:"): current_data['scale'] = parse_vector3(line)
-            if line.startswith("m_Father:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['father'] = fid.group(1)
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
-
-        elif current_type == 33: # MeshFilter
-            if line.startswith("m_Mesh:"):
-                guid = GUID_PATTERN.search(line)
-                if guid: current_data['mesh_guid'] = guid.group(1)
-            if line.startswith("m_GameObject:"):
-                fid = FILE_ID_PATTERN.search(line)
-                if fid: current_data['game_object'] = fid.group(1)
+        if not current_id: continue
+    
+        # One partition + one dict lookup per line
+        if handlers:
+            key, sep, value = line.partition(b':')
+            if sep:
+                handler = handlers.get(key)
+                if handler: handler(value, current_data)
 
     if current_id:
-        if current_type == 1: game_objects[current_id] = current_data
-        elif current_type == 4: transforms[current_id] = current_data
-        elif current_type == 33: mesh_filters[current_id] = current_data
+        finish_record(current_type, current_id, current_data)
 
     # 2. Build Tree
     hierarchy = []
     
-    # Helper to find Transform for a GO
-    go_to_trans_id = {}
-    for tid, tdata in transforms.items():
-        if tdata['game_object']:
-            go_to_trans_id[tdata['game_object']] = tid
-            
-    # Helper to find Mesh for a GO
-    go_to_mesh_filename = {}
-    for mid, mdata in mesh_filters.items():
-        if mdata['game_object'] and mdata['mesh_guid']:
-            filename = mesh_guid_map.get(mdata['mesh_guid'])
-            if filename:
-                go_to_mesh_filename[mdata['game_object']] = filename
-
     for go_id, go_data in game_objects.items():
         if go_id not in go_to_trans_id:
             continue
@@ -155,8 +162,20 @@ def main():
             "mesh_asset": mesh_filename 
         })
         
-    with open(OUTPUT_JSON, 'w') as f:
-        json.dump(hierarchy, f, indent=2)
+    return hierarchy
+
+def main():
+    print(f"Parsing hierarchy from {SCENE_PATH}...")
+    
+    # 0. Build Mesh GUID Map
+    print("Building Mesh GUID map...")
+    mesh_guid_map = build_guid_map(MESH_DIR, ext_filter=[".obj", ".fbx"], names_only=True)
+    
+    # Stream the scene as bytes: every parsed field is ASCII, so only names get decoded
+    with open(SCENE_PATH, 'rb', buffering=1024 * 1024) as f:
+        hierarchy = build_hierarchy(f, mesh_guid_map)
+        
+    write_json(OUTPUT_JSON, hierarchy)
         
     print(f"Exported hierarchy of {len(hierarchy)} objects to {OUTPUT_JSON}")
 
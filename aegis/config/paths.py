@@ -4,6 +4,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 __all__ = [
@@ -12,9 +13,18 @@ __all__ = [
     "ensure_parent",
 ]
 
+# Set once the config directory has been created in this process.
+_CONFIG_DIR_READY = False
+# Parent directories already created by ensure_parent.
+_ENSURED_PARENTS: set[Path] = set()
 
+
+@lru_cache(maxsize=1)
 def get_config_directory() -> Path:
-    """Return the platform-specific configuration directory."""
+    """Return the platform-specific configuration directory.
+
+    The result is cached for the lifetime of the process.
+    """
 
     home = Path.home()
     if sys.platform.startswith("win"):
@@ -33,13 +43,20 @@ def get_config_directory() -> Path:
 def get_config_path() -> Path:
     """Return the canonical configuration file path."""
 
+    global _CONFIG_DIR_READY
     directory = get_config_directory()
-    directory.mkdir(parents=True, exist_ok=True)
+    if not _CONFIG_DIR_READY:
+        directory.mkdir(parents=True, exist_ok=True)
+        _CONFIG_DIR_READY = True
     return directory / "config.json"
 
 
 def ensure_parent(path: Path) -> None:
     """Ensure the parent directory of ``path`` exists."""
 
-    path.parent.mkdir(parents=True, exist_ok=True)
+    parent = path.parent
+    if parent in _ENSURED_PARENTS:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    _ENSURED_PARENTS.add(parent)
 
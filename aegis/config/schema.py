@@ -4,7 +4,9 @@
 
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -12,48 +14,102 @@ from platformdirs import PlatformDirs
 
 LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_OLLAMA_URL = "http://localhost:11434"
+_DEFAULT_HOTKEY = "alt+space"
+_DEFAULT_POLL_INTERVAL = 0.5
 
-@dataclass
-class ClipboardVaultSettings:
+
+@lru_cache(maxsize=64)
+def _expand_path(value: str) -> Path:
+    # Keyed by the string, so reassigning a *_path/*_root field is picked up
+    return Path(value).expanduser()
+
+
+# One payload per settings class for instances built entirely from defaults.
+_DEFAULT_PAYLOADS: Dict[type, Dict[str, Any]] = {}
+
+
+class _CachedPayload:
+    """Keep the serialized form of a settings object until one of its fields is assigned."""
+
+    # Plain slots rather than dataclass fields, so asdict(), repr() and == never see them.
+    # _json holds the (payload, indent, text) of the last AppConfig.json() call.
+    __slots__ = ("_payload", "_json")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_payload", None)
+
+    def _as_payload(self) -> Dict[str, Any]:
+        # Shared and never handed out directly: callers get copies via to_dict
+        payload = self._payload
+        if payload is None:
+            payload = asdict(self)
+            object.__setattr__(self, "_payload", payload)
+        return payload
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._as_payload())
+
+    @classmethod
+    def _defaults(cls) -> Any:
+        """Return a new all-defaults instance carrying the interned default payload."""
+
+        instance = cls()
+        payload = _DEFAULT_PAYLOADS.get(cls)
+        if payload is None:
+            payload = _DEFAULT_PAYLOADS[cls] = asdict(instance)
+        object.__setattr__(instance, "_payload", payload)
+        return instance
+
+
+@dataclass(slots=True)
+class ClipboardVaultSettings(_CachedPayload):
     enabled: bool = False
     max_items: int = 100
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ClipboardVaultSettings":
+    def from_dict(cls, data: Dict[str, Any] | None) -> "ClipboardVaultSettings":
+        if not data:
+            return cls._defaults()
         max_items = int(data.get("max_items", 100))
         if max_items < 1:
             max_items = 1
         return cls(enabled=bool(data.get("enabled", False)), max_items=max_items)
 
 
-@dataclass
-class SchedulerSettings:
+@dataclass(slots=True)
+class SchedulerSettings(_CachedPayload):
     archive_days: int = 30
     zip_monthly: bool = False
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SchedulerSettings":
+    def from_dict(cls, data: Dict[str, Any] | None) -> "SchedulerSettings":
+        if not data:
+            return cls._defaults()
         archive_days = int(data.get("archive_days", 30))
         if archive_days < 1:
             archive_days = 1
         return cls(archive_days=archive_days, zip_monthly=bool(data.get("zip_monthly", False)))
 
 
-@dataclass
-class WatcherSettings:
+@dataclass(slots=True)
+class WatcherSettings(_CachedPayload):
     desktop: bool = True
     downloads: bool = True
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "WatcherSettings":
+    def from_dict(cls, data: Dict[str, Any] | None) -> "WatcherSettings":
+        if not data:
+            return cls._defaults()
         return cls(
             desktop=bool(data.get("desktop", True)),
             downloads=bool(data.get("downloads", True)),
         )
 
 
-@dataclass
-class AppConfig:
+@dataclass(slots=True)
+class AppConfig(_CachedPayload):
     desktop_path: str
     downloads_path: str
     archive_root: str
@@ -61,72 +117,76 @@ class AppConfig:
     snippets_root: str
     quarantine_root: str
     use_ollama: bool = False
-    ollama_url: str = "http://localhost:11434"
-    clipboard_poll_interval: float = 0.5
-    clipboard_vault: ClipboardVaultSettings = field(default_factory=ClipboardVaultSettings)
-    watchers: WatcherSettings = field(default_factory=WatcherSettings)
-    scheduler: SchedulerSettings = field(default_factory=SchedulerSettings)
-    hotkey: str = "alt+space"
+    ollama_url: str = _DEFAULT_OLLAMA_URL
+    clipboard_poll_interval: float = _DEFAULT_POLL_INTERVAL
+    clipboard_vault: ClipboardVaultSettings = field(
+        default_factory=ClipboardVaultSettings._defaults
+    )
+    watchers: WatcherSettings = field(default_factory=WatcherSettings._defaults)
+    scheduler: SchedulerSettings = field(default_factory=SchedulerSettings._defaults)
+    hotkey: str = _DEFAULT_HOTKEY
+    tray_enabled: bool = True
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppConfig":
-        def _expand(value: str) -> str:
-            return str(Path(value).expanduser())
-
-        clipboard_vault = ClipboardVaultSettings.from_dict(data.get("clipboard_vault", {}))
-        watchers = WatcherSettings.from_dict(data.get("watchers", {}))
-        scheduler = SchedulerSettings.from_dict(data.get("scheduler", {}))
-        poll_interval = float(data.get("clipboard_poll_interval", 0.5))
+        get = data.get
+        expanduser = os.path.expanduser
+        poll_interval = float(get("clipboard_poll_interval", _DEFAULT_POLL_INTERVAL))
         if poll_interval <= 0:
-            poll_interval = 0.5
+            poll_interval = _DEFAULT_POLL_INTERVAL
         return cls(
-            desktop_path=_expand(data["desktop_path"]),
-            downloads_path=_expand(data["downloads_path"]),
-            archive_root=_expand(data["archive_root"]),
-            reports_root=_expand(data["reports_root"]),
-            snippets_root=_expand(data["snippets_root"]),
-            quarantine_root=_expand(data["quarantine_root"]),
-            desktop_path=data["desktop_path"],
-            downloads_path=data["downloads_path"],
-            archive_root=data["archive_root"],
-            reports_root=data["reports_root"],
-            snippets_root=data["snippets_root"],
-            quarantine_root=data["quarantine_root"],
-            use_ollama=bool(data.get("use_ollama", False)),
-            ollama_url=str(data.get("ollama_url", "http://localhost:11434")),
+            desktop_path=expanduser(data["desktop_path"]),
+            downloads_path=expanduser(data["downloads_path"]),
+            archive_root=expanduser(data["archive_root"]),
+            reports_root=expanduser(data["reports_root"]),
+            snippets_root=expanduser(data["snippets_root"]),
+            quarantine_root=expanduser(data["quarantine_root"]),
+            use_ollama=bool(get("use_ollama", False)),
+            ollama_url=str(get("ollama_url", _DEFAULT_OLLAMA_URL)),
             clipboard_poll_interval=poll_interval,
-            clipboard_vault=clipboard_vault,
-            watchers=watchers,
-            scheduler=scheduler,
-            hotkey=str(data.get("hotkey", "alt+space")),
+            clipboard_vault=ClipboardVaultSettings.from_dict(get("clipboard_vault")),
+            watchers=WatcherSettings.from_dict(get("watchers")),
+            scheduler=SchedulerSettings.from_dict(get("scheduler")),
+            hotkey=str(get("hotkey", _DEFAULT_HOTKEY)),
+            tray_enabled=bool(get("tray_enabled", True)),
         )
 
     @property
     def desktop_dir(self) -> Path:
-        return Path(self.desktop_path).expanduser()
+        return _expand_path(self.desktop_path)
 
     @property
     def downloads_dir(self) -> Path:
-        return Path(self.downloads_path).expanduser()
+        return _expand_path(self.downloads_path)
 
     @property
     def archive_dir(self) -> Path:
-        return Path(self.archive_root).expanduser()
+        return _expand_path(self.archive_root)
 
     @property
     def reports_dir(self) -> Path:
-        return Path(self.reports_root).expanduser()
+        return _expand_path(self.reports_root)
 
     @property
     def snippets_dir(self) -> Path:
-        return Path(self.snippets_root).expanduser()
+        return _expand_path(self.snippets_root)
 
     @property
     def quarantine_dir(self) -> Path:
-        return Path(self.quarantine_root).expanduser()
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
+        return _expand_path(self.quarantine_root)
+
+    def _as_payload(self) -> Dict[str, Any]:
+        payload = self._payload
+        # Nested sections are edited in place by the settings dialog, so their own
+        # cached payloads must still be the ones this one was built from.
+        if (
+            payload is not None
+            and payload["clipboard_vault"] is self.clipboard_vault._as_payload()
+            and payload["watchers"] is self.watchers._as_payload()
+            and payload["scheduler"] is self.scheduler._as_payload()
+        ):
+            return payload
+        payload = {
             "desktop_path": self.desktop_path,
             "downloads_path": self.downloads_path,
             "archive_root": self.archive_root,
@@ -136,14 +196,75 @@ class AppConfig:
             "use_ollama": self.use_ollama,
             "ollama_url": self.ollama_url,
             "clipboard_poll_interval": self.clipboard_poll_interval,
-            "clipboard_vault": self.clipboard_vault.__dict__,
-            "watchers": self.watchers.__dict__,
-            "scheduler": self.scheduler.__dict__,
+            "clipboard_vault": self.clipboard_vault._as_payload(),
+            "watchers": self.watchers._as_payload(),
+            "scheduler": self.scheduler._as_payload(),
             "hotkey": self.hotkey,
+            "tray_enabled": self.tray_enabled,
         }
+        object.__setattr__(self, "_payload", payload)
+        return payload
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = dict(self._as_payload())
+        for key in _NESTED_KEYS:
+            data[key] = dict(data[key])
+        return data
 
     def json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent)
+        payload = self._as_payload()
+        cached = getattr(self, "_json", None)
+        if cached is None or cached[0] is not payload or cached[1] != indent:
+            cached = (payload, indent, json.dumps(payload, indent=indent))
+            object.__setattr__(self, "_json", cached)
+        return cached[2]
+
+
+_REQUIRED_KEYS = (
+    "desktop_path",
+    "downloads_path",
+    "archive_root",
+    "reports_root",
+    "snippets_root",
+    "quarantine_root",
+)
+
+
+def is_config_complete(data: Dict[str, Any]) -> bool:
+    """Return ``True`` when every required path setting is a non-empty string."""
+
+    for key in _REQUIRED_KEYS:
+        value = data.get(key)
+        if not isinstance(value, str) or not value.strip():
+            return False
+    return True
+
+
+# Last data written per path with the file's mtime_ns right after the write.
+_SAVED: Dict[Path, tuple[int, Dict[str, Any]]] = {}
+
+
+def save_config(config: AppConfig, path: Path | None = None) -> Path:
+    """Write ``config`` as JSON to ``path`` (the user config file by default).
+
+    The write is skipped when the same data was last saved to an unmodified file.
+    """
+
+    target = path or config_dir() / "config.json"
+    # The cached payload is never mutated, so it can be kept in _SAVED as is
+    data = config._as_payload()
+    saved = _SAVED.get(target)
+    if saved is not None and saved[1] == data:
+        try:
+            if target.stat().st_mtime_ns == saved[0]:
+                return target
+        except FileNotFoundError:
+            pass
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    _SAVED[target] = (target.stat().st_mtime_ns, data)
+    return target
 
 
 def defaults_path() -> Path:
@@ -155,25 +276,73 @@ def config_dir() -> Path:
     path = Path(dirs.user_config_dir)
     path.mkdir(parents=True, exist_ok=True)
     return path
-    return Path(dirs.user_config_dir)
+
+
+def _read_defaults() -> Dict[str, Any] | None:
+    try:
+        return json.loads(defaults_path().read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+
+
+# Sections merged key by key rather than replaced wholesale by the user file.
+_NESTED_KEYS = ("clipboard_vault", "watchers", "scheduler")
+
+
+def _nested_defaults(defaults: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return {key: defaults.get(key, {}) for key in _NESTED_KEYS}
+
+
+# Parsed once at import; loaded lazily if the file was missing at that point.
+_DEFAULTS: Dict[str, Any] | None = _read_defaults()
+_NESTED_DEFAULTS: Dict[str, Dict[str, Any]] = (
+    _nested_defaults(_DEFAULTS) if _DEFAULTS is not None else {}
+)
+
+# Merged config data for the last user file seen, keyed by (path, mtime_ns, size).
+_USER_CACHE: Dict[Path, tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _get_defaults() -> Dict[str, Any]:
+    global _DEFAULTS, _NESTED_DEFAULTS
+    if _DEFAULTS is None:
+        _DEFAULTS = json.loads(defaults_path().read_text(encoding="utf-8"))
+        _NESTED_DEFAULTS = _nested_defaults(_DEFAULTS)
+    return _DEFAULTS
+
+
+def _merge(defaults: Dict[str, Any], user_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Overlay ``user_data`` on ``defaults``; nested sections merge per key."""
+
+    merged = defaults.copy()
+    merged.update(user_data)
+    for key in _NESTED_KEYS:
+        if key in user_data:
+            merged[key] = {**_NESTED_DEFAULTS[key], **user_data[key]}
+    return merged
 
 
 def load_config(user_config: Path | None = None) -> AppConfig:
-    defaults = json.loads(defaults_path().read_text(encoding="utf-8"))
+    defaults = _get_defaults()
     config_data: Dict[str, Any] = dict(defaults)
-    config_data: Dict[str, Any] = defaults
     path = user_config or config_dir() / "config.json"
-    if path.exists():
-        try:
-            user_data = json.loads(path.read_text(encoding="utf-8"))
-            merged = {**defaults, **user_data}
-            # nested dicts need merging explicitly
-            for key in ["clipboard_vault", "watchers", "scheduler"]:
-                if key in user_data:
-                    merged[key] = {**defaults.get(key, {}), **user_data.get(key, {})}
-            config_data = merged
-        except json.JSONDecodeError as exc:  # pragma: no cover
-            LOGGER.error("Invalid JSON in %s: %s", path, exc)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        stat = None
+    if stat is not None:
+        cached = _USER_CACHE.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            config_data = cached[2]
+        else:
+            try:
+                user_data = json.loads(path.read_text(encoding="utf-8"))
+                merged = _merge(defaults, user_data)
+                config_data = merged
+                _USER_CACHE[path] = (stat.st_mtime_ns, stat.st_size, merged)
+            except json.JSONDecodeError as exc:  # pragma: no cover
+                LOGGER.error("Invalid JSON in %s: %s", path, exc)
+    # A fresh AppConfig every call: callers mutate the returned instance.
     return AppConfig.from_dict(config_data)
 
 
@@ -183,6 +352,8 @@ __all__ = [
     "SchedulerSettings",
     "WatcherSettings",
     "load_config",
+    "save_config",
+    "is_config_complete",
     "config_dir",
     "defaults_path",
 ]
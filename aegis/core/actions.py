@@ -2,35 +2,111 @@
 
 
 
+import errno
 import logging
+import os
+import queue
 import shutil
-from collections import deque
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from ..config.schema import AppConfig
 from .bus import EventBus, FileSystemEvent, NotificationEvent
-from .classifiers import classify_file, classify_text
+from .classifiers import ARCHIVE_EXTENSIONS, classify_file, classify_text
 from .renamer import Renamer
 from .summarizer import Summarizer
 from .utils import ensure_directory, timestamp_folder, day_folder, hash_text, sanitize_filename
 from .quarantine import Quarantine
-
-from ..config.schema import AppConfig
-from .bus import EventBus, FileSystemEvent, NotificationEvent
-from .classifiers import classify_file
-from .renamer import Renamer
-from .summarizer import Summarizer
-from .utils import ensure_directory, timestamp_folder
 from .vault import ClipboardVault
 
 LOGGER = logging.getLogger(__name__)
 
+# Watched folder per label. Resolved through the config on each call since the
+# settings UI can repoint the folders while the executor is alive.
+_LABEL_ROOTS = {
+    "desktop": attrgetter("desktop_dir"),
+    "downloads": attrgetter("downloads_dir"),
+}
+
+# link/unlink/rename relative to open directory handles (linkat etc.); missing on Windows
+_DIR_FD_MOVES = {os.link, os.unlink, os.rename, os.stat} <= os.supports_dir_fd
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+# Hard-link a symlink itself rather than its target where the platform allows it
+_LINK_FLAGS = {"follow_symlinks": False} if os.link in os.supports_follow_symlinks else {}
+
+# Clipboard entries written to the vault per transaction, and how long the worker
+# waits for more entries to join a batch
+_VAULT_BATCH_SIZE = 32
+_VAULT_BATCH_WAIT = 0.05
+# Attempts for a batch hitting a busy/locked database before storing entries one by one
+_VAULT_BATCH_ATTEMPTS = 3
+# Queued after everything else by close(); the worker flushes and exits
+_VAULT_STOP = object()
+
+# str.endswith wants a tuple; lets the event handler test the raw path string
+_ARCHIVE_SUFFIXES = tuple(ARCHIVE_EXTENSIONS)
+
+
+def _name_key(name: str) -> str:
+    # Archive volumes may be case-insensitive (macOS, Windows): compare names the way they do
+    return os.path.normcase(name).casefold()
+
+
+def _move_no_clobber(
+    src: str,
+    dst: str | Path,
+    same_fs: bool,
+    src_dir_fd: Optional[int] = None,
+    dst_dir_fd: Optional[int] = None,
+) -> None:
+    """Move ``src`` to ``dst``, raising ``FileExistsError`` rather than replacing ``dst``.
 
-@dataclass
+    With directory descriptors, ``src`` and ``dst`` are names relative to them.
+    """
+
+    if same_fs:
+        try:
+            # link(2) refuses a taken name atomically, whatever the volume's case rules
+            os.link(src, dst, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd, **_LINK_FLAGS)
+        except FileExistsError:
+            raise
+        except (OSError, NotImplementedError):
+            pass  # No hard links on this volume (FAT, some shares): probe, then rename
+        else:
+            try:
+                os.unlink(src, dir_fd=src_dir_fd)
+            except OSError:
+                os.unlink(dst, dir_fd=dst_dir_fd)
+                raise
+            return
+    try:
+        os.stat(dst, dir_fd=dst_dir_fd, follow_symlinks=False)
+    except FileNotFoundError:
+        pass
+    else:
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), os.fspath(dst))
+    if same_fs:
+        try:
+            os.replace(src, dst, src_dir_fd=src_dir_fd, dst_dir_fd=dst_dir_fd)
+            return
+        except OSError as exc:
+            # Bind mounts and overlay/container volumes can share st_dev yet refuse
+            # renames across them. Names relative to dir fds are the caller's to retry.
+            if exc.errno != errno.EXDEV or src_dir_fd is not None or dst_dir_fd is not None:
+                raise
+    shutil.move(src, dst)
+
+
+@dataclass(slots=True)
 class ArchiveResult:
     archive_root: Path
     moved_files: list[Path]
@@ -43,30 +119,65 @@ class ActionExecutor:
         self.bus = bus
         self.notifier = notifier
         self.config = config
-        self.renamer = Renamer(config)
-        self.summarizer = Summarizer(config)
-        self.vault = ClipboardVault(config)
-        self.snippets_root = Path(config.snippets_root).expanduser()
+        self.snippets_root = config.snippets_dir
         ensure_directory(self.snippets_root)
-        self._clipboard_history: deque[str] = deque(maxlen=config.clipboard_vault.max_items)
-        self._last_file: Optional[Path] = None
-        self._watcher_paused_until: Optional[datetime] = None
-        self.quarantine = Quarantine(config)
-        self._clipboard_history: deque[str] = deque(maxlen=config.clipboard_vault.max_items)
-        self._last_file: Optional[Path] = None
-        self._watcher_paused_until: Optional[datetime] = None
+        # Fixed-size ring buffer of recent clipboard entries; _clip_head is the next write slot
+        self._clip_size = config.clipboard_vault.max_items
+        self._clip_buf: list[Optional[str]] = [None] * self._clip_size
+        self._clip_head = 0
+        self._clip_len = 0
+        # Kept as the raw string; only wrapped in a Path when a rename asks for it
+        self._last_file: Optional[str] = None
+        # time.monotonic() deadline; immune to wall-clock jumps and cheap to compare
+        self._watcher_paused_until: Optional[float] = None
+        # Vault writes are handed to a worker thread, started on the first one. Besides
+        # entries the queue carries wipe requests (a Future) and _VAULT_STOP, all in order.
+        self._vault_queue: queue.SimpleQueue[object] = queue.SimpleQueue()
+        self._vault_worker: Optional[threading.Thread] = None
         self.bus.subscribe("filesystem", self._on_filesystem_event)
         self.bus.subscribe("notification", self._on_notification_event)
 
+    # Helpers are built on first use: a session that never renames, summarizes,
+    # opens the vault or quarantines anything skips their setup (vault key derivation,
+    # quarantine/report directories) entirely.
+    @cached_property
+    def renamer(self) -> Renamer:
+        return Renamer(self.config)
+
+    @cached_property
+    def summarizer(self) -> Summarizer:
+        return Summarizer(self.config)
+
+    @cached_property
+    def vault(self) -> ClipboardVault:
+        return ClipboardVault(self.config)
+
+    @cached_property
+    def quarantine(self) -> Quarantine:
+        return Quarantine(self.config)
+
+    def close(self) -> None:
+        """Release resources held by helpers that were actually created."""
+
+        worker = self._vault_worker
+        if worker is not None:
+            # The stop marker is queued behind every pending entry, so joining writes them all
+            self._vault_queue.put(_VAULT_STOP)
+            worker.join()
+            self._vault_worker = None
+        vault = self.__dict__.get("vault")
+        if vault is not None:
+            vault.close()
+
     # Event handlers -------------------------------------------------------
     def _on_filesystem_event(self, event: FileSystemEvent) -> None:
         if not self.watchers_active():
             LOGGER.debug("Ignoring filesystem event while watchers paused")
             return
-        path = Path(event.path)
-        self._last_file = path
-        classification = classify_file(path)
-        if classification.label == "archive":
+        self._last_file = event.path
+        # Only archives need inspecting; a string suffix check skips everything else
+        if event.path.lower().endswith(_ARCHIVE_SUFFIXES):
+            path = Path(event.path)
             indicators = self.quarantine.inspect_archive(path)
             if indicators:
                 record = self.quarantine.isolate(
@@ -85,7 +196,6 @@ class ActionExecutor:
                     )
                 )
                 return
-        self._last_file = Path(event.path)
 
     def _on_notification_event(self, event: NotificationEvent) -> None:
         self.notifier.notify(event.message, level=event.level)
@@ -103,21 +213,83 @@ class ActionExecutor:
             if cleaned != processed:
                 processed = cleaned
                 self.bus.publish(NotificationEvent("Cleaned tracking parameters from URL", level="info"))
-        LOGGER.debug("Recording clipboard content of length %s", len(processed))
-        self._clipboard_history.appendleft(processed)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Recording clipboard content of length %s", len(processed))
+        self._clip_buf[self._clip_head] = processed
+        self._clip_head = (self._clip_head + 1) % self._clip_size
+        if self._clip_len < self._clip_size:
+            self._clip_len += 1
         if classification.label == "code":
             snippet_path = self._save_code_snippet(processed, classification.details.get("language"))
             if snippet_path:
                 self.bus.publish(NotificationEvent(f"Saved snippet to {snippet_path.name}", level="success"))
         if self.config.clipboard_vault.enabled:
-            self.vault.store(processed)
-        LOGGER.debug("Recording clipboard content of length %s", len(content))
-        self._clipboard_history.appendleft(content)
-        if self.config.clipboard_vault.enabled:
-            self.vault.store(content)
+            self._queue_vault_store(processed)
+
+    def _queue_vault_store(self, content: str) -> None:
+        if self._vault_worker is None:
+            # Built here, on the clipboard thread, so the worker never races another
+            # thread into creating a second vault
+            vault = self.vault
+            self._vault_worker = threading.Thread(
+                target=self._drain_vault, args=(vault,), name="aegis-vault", daemon=True
+            )
+            self._vault_worker.start()
+        self._vault_queue.put(content)
+
+    def _drain_vault(self, vault: ClipboardVault) -> None:
+        pending = self._vault_queue
+        batch: list[str] = []
+        while True:
+            # With entries in hand, wait briefly so a burst of copies shares one transaction
+            try:
+                item = pending.get(timeout=_VAULT_BATCH_WAIT) if batch else pending.get()
+            except queue.Empty:
+                item = None
+            if isinstance(item, str):
+                batch.append(item)
+                if len(batch) < _VAULT_BATCH_SIZE:
+                    continue
+            # Anything other than another entry flushes first, so a wipe or stop always
+            # comes after the entries queued before it
+            if batch:
+                self._store_vault_batch(vault, batch)
+                batch = []
+            if item is _VAULT_STOP:
+                return
+            if isinstance(item, Future):
+                try:
+                    vault.wipe()
+                except Exception as exc:
+                    item.set_exception(exc)
+                else:
+                    item.set_result(None)
+
+    @staticmethod
+    def _store_vault_batch(vault: ClipboardVault, batch: list[str]) -> None:
+        for attempt in range(1, _VAULT_BATCH_ATTEMPTS + 1):
+            try:
+                vault.store_many(batch)
+                return
+            except sqlite3.OperationalError:
+                # Usually a busy/locked database: back off and retry the whole batch
+                LOGGER.warning("Vault busy storing %s entries (attempt %s)", len(batch), attempt)
+                time.sleep(0.1 * attempt)
+            except Exception:
+                LOGGER.exception("Failed to store %s clipboard entries as a batch", len(batch))
+                break
+        # Store entries one by one so a single bad entry cannot take the rest with it
+        failed = 0
+        for content in batch:
+            try:
+                vault.store(content)
+            except Exception:
+                failed += 1
+        if failed:
+            LOGGER.error("Clipboard vault could not store %s of %s entries", failed, len(batch))
 
     def clipboard_snapshot(self) -> Optional[str]:
-        return self._clipboard_history[0] if self._clipboard_history else None
+        return self._clip_buf[self._clip_head - 1] if self._clip_len else None
 
     def summarize_clipboard(self) -> Optional[str]:
         latest = self.clipboard_snapshot()
@@ -131,7 +303,14 @@ class ActionExecutor:
         return self.vault.search(query)
 
     def wipe_vault(self) -> None:
-        self.vault.wipe()
+        if self._vault_worker is not None:
+            # Goes through the worker so entries still queued are written before the wipe
+            # and never outlive it
+            done: Future[None] = Future()
+            self._vault_queue.put(done)
+            done.result()
+        else:
+            self.vault.wipe()
         self.bus.publish(NotificationEvent("Clipboard vault wiped", level="success"))
 
     def _save_code_snippet(self, content: str, language: Optional[str]) -> Optional[Path]:
@@ -163,26 +342,29 @@ class ActionExecutor:
 
     # Files ----------------------------------------------------------------
     def register_file_event(self, path: Path) -> None:
-        self._last_file = path
+        self._last_file = os.fspath(path)
 
     def organize_directory(self, label: str) -> ArchiveResult:
-        if label not in {"desktop", "downloads"}:
+        get_root = _LABEL_ROOTS.get(label)
+        if get_root is None:
             raise ValueError(f"Unknown label {label}")
-        root = Path(getattr(self.config, f"{label}_path")).expanduser()
-        archive_root = Path(self.config.archive_root).expanduser() / timestamp_folder()
-        ensure_directory(archive_root)
+        root = get_root(self.config)
+        archive_root, used_names = self._prepare_archive_folder()
         moved: list[Path] = []
         if not root.exists():
             return ArchiveResult(archive_root, moved)
-        for path in root.iterdir():
-            if path.is_file():
-                destination = archive_root / path.name
-                counter = 1
-                while destination.exists():
-                    destination = archive_root / f"{path.stem}-{counter}{path.suffix}"
-                    counter += 1
-                LOGGER.info("Archiving %s to %s", path, destination)
-                shutil.move(str(path), destination)
+        # Same device: link and unlink in place, without shutil.move's copy fallback
+        same_fs = os.stat(root).st_dev == os.stat(archive_root).st_dev
+        # Checked once per batch rather than going through the logger for every file
+        log_moves = LOGGER.isEnabledFor(logging.INFO)
+        # scandir hands back file types with the listing; list first since we move while looping
+        with os.scandir(root) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_file():
+                destination = self._archive_entry(entry, archive_root, used_names, same_fs)
+                if log_moves:
+                    LOGGER.info("Archived %s to %s", entry.path, destination)
                 moved.append(destination)
                 self.bus.publish(
                     FileSystemEvent(str(destination), event_type="archived", label=label)
@@ -193,54 +375,137 @@ class ActionExecutor:
             )
         return ArchiveResult(archive_root=archive_root, moved_files=moved)
 
+    def _prepare_archive_folder(self) -> tuple[Path, set[str]]:
+        """Create this month's archive folder and return it with the names already in it."""
+
+        archive_root = self.config.archive_dir / timestamp_folder()
+        ensure_directory(archive_root)
+        # The month folder is reused across runs: scan it once and pick names in memory.
+        # The set can go stale (other threads, other processes); moves never overwrite.
+        return archive_root, {_name_key(name) for name in os.listdir(archive_root)}
+
+    @staticmethod
+    def _claim_name(name: str, used_names: set[str]) -> str:
+        stem, suffix = os.path.splitext(name)
+        candidate = name
+        counter = 1
+        while _name_key(candidate) in used_names:
+            candidate = f"{stem}-{counter}{suffix}"
+            counter += 1
+        used_names.add(_name_key(candidate))
+        return candidate
+
+    def _archive_entry(
+        self,
+        entry: os.DirEntry,
+        archive_root: Path,
+        used_names: set[str],
+        same_fs: bool,
+        dir_fds: Optional[tuple[int, int]] = None,
+    ) -> Path:
+        """Move ``entry`` into ``archive_root`` under a free name and return its new path."""
+
+        while True:
+            name = self._claim_name(entry.name, used_names)
+            try:
+                if dir_fds is not None:
+                    try:
+                        _move_no_clobber(entry.name, name, same_fs, *dir_fds)
+                    except OSError as exc:
+                        if exc.errno != errno.EXDEV:
+                            raise
+                        # Same st_dev, but the mount refuses the rename: copy by path
+                        _move_no_clobber(entry.path, archive_root / name, same_fs=False)
+                else:
+                    _move_no_clobber(entry.path, archive_root / name, same_fs)
+            except FileExistsError:
+                # Taken since the folder was listed; the name stays claimed, try the next one
+                continue
+            return archive_root / name
+
     def rename_last_file(self, params: dict[str, object]) -> Optional[Path]:
-        if not self._last_file or not self._last_file.exists():
+        if not self._last_file:
+            return None
+        last_file = Path(self._last_file)
+        if not last_file.exists():
             return None
         keywords = []
         if "style" in params and isinstance(params["style"], str):
             keywords.append(params["style"])
-        classification = classify_file(self._last_file)
+        classification = classify_file(last_file)
         keywords.append(classification.label)
-        renamed = self.renamer.rename(self._last_file, keywords)
+        renamed = self.renamer.rename(last_file, keywords)
         self.bus.publish(
             NotificationEvent(f"Renamed file to {renamed.name}", level="success")
         )
         return renamed
 
     def archive_old_files(self, age_days: int) -> ArchiveResult:
-        cutoff = datetime.utcnow() - timedelta(days=age_days)
-        archive_root = Path(self.config.archive_root).expanduser() / timestamp_folder()
-        ensure_directory(archive_root)
+        cutoff_ts = time.time() - timedelta(days=age_days).total_seconds()
+        archive_root, used_names = self._prepare_archive_folder()
         moved: list[Path] = []
-        for label in ("desktop", "downloads"):
-            root = Path(getattr(self.config, f"{label}_path")).expanduser()
+        log_moves = LOGGER.isEnabledFor(logging.INFO)
+        for get_root in _LABEL_ROOTS.values():
+            root = get_root(self.config)
             if not root.exists():
                 continue
-            for path in root.iterdir():
-                if path.is_file() and datetime.utcfromtimestamp(path.stat().st_mtime) < cutoff:
-                    destination = archive_root / path.name
-                    counter = 1
-                    while destination.exists():
-                        destination = archive_root / f"{path.stem}-{counter}{path.suffix}"
-                        counter += 1
-                    LOGGER.info("Auto-archiving %s", path)
-                    shutil.move(str(path), destination)
-                    moved.append(destination)
+            same_fs = os.stat(root).st_dev == os.stat(archive_root).st_dev
+            with os.scandir(root) as it:
+                batch = [
+                    entry
+                    for entry in it
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_ts
+                ]
+            if not batch:
+                continue
+            if log_moves:
+                for entry in batch:
+                    LOGGER.info("Auto-archiving %s", entry.path)
+            moved.extend(self._move_batch(root, archive_root, batch, used_names, same_fs))
         if moved:
             self.bus.publish(
                 NotificationEvent(f"Archived {len(moved)} files to {archive_root}")
             )
         return ArchiveResult(archive_root=archive_root, moved_files=moved)
 
+    def _move_batch(
+        self,
+        root: Path,
+        archive_root: Path,
+        batch: list[os.DirEntry],
+        used_names: set[str],
+        same_fs: bool,
+    ) -> list[Path]:
+        """Archive every entry of ``batch`` from ``root`` and return the new paths."""
+
+        if same_fs and _DIR_FD_MOVES:
+            # Both folders are opened once; each move then only resolves bare names
+            src_fd = os.open(root, _DIR_FLAGS)
+            try:
+                dst_fd = os.open(archive_root, _DIR_FLAGS)
+                try:
+                    return [
+                        self._archive_entry(
+                            entry, archive_root, used_names, same_fs, (src_fd, dst_fd)
+                        )
+                        for entry in batch
+                    ]
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        return [self._archive_entry(entry, archive_root, used_names, same_fs) for entry in batch]
+
     # Watchers -------------------------------------------------------------
     def pause_watchers(self, minutes: int) -> None:
-        self._watcher_paused_until = datetime.utcnow() + timedelta(minutes=minutes)
+        self._watcher_paused_until = time.monotonic() + minutes * 60
         self.bus.publish(NotificationEvent(f"Watchers paused for {minutes} minutes", level="info"))
 
     def watchers_active(self) -> bool:
-        if not self._watcher_paused_until:
+        deadline = self._watcher_paused_until
+        if deadline is None:
             return True
-        if datetime.utcnow() > self._watcher_paused_until:
+        if time.monotonic() > deadline:
             self._watcher_paused_until = None
             return True
         return False
@@ -3,10 +3,9 @@
 
 
 import logging
-from collections import defaultdict
 from dataclasses import dataclass
 from threading import RLock
-from typing import Callable, DefaultDict, Iterable, Protocol
+from typing import Callable, Dict, Protocol
 
 LOGGER = logging.getLogger(__name__)
 
@@ -62,7 +61,9 @@ class EventBus:
     """A lightweight thread-safe pub/sub bus."""
 
     def __init__(self) -> None:
-        self._subscribers: DefaultDict[str, list[Callback]] = defaultdict(list)
+        # Copy-on-write: each tuple is replaced wholesale under the lock, never mutated,
+        # so publish can read the current one without locking.
+        self._subscribers: Dict[str, tuple[Callback, ...]] = {}
         self._lock = RLock()
 
     def subscribe(self, event_name: str, callback: Callback) -> None:
@@ -70,7 +71,7 @@ class EventBus:
 
         with self._lock:
             LOGGER.debug("Subscribing %s to %s", callback, event_name)
-            self._subscribers[event_name].append(callback)
+            self._subscribers[event_name] = self._subscribers.get(event_name, ()) + (callback,)
 
     def unsubscribe(self, event_name: str, callback: Callback) -> None:
         """Unsubscribe from an event."""
@@ -78,17 +79,14 @@ class EventBus:
         with self._lock:
             if event_name in self._subscribers:
                 LOGGER.debug("Unsubscribing %s from %s", callback, event_name)
-                self._subscribers[event_name] = [
+                self._subscribers[event_name] = tuple(
                     cb for cb in self._subscribers[event_name] if cb != callback
-                ]
+                )
 
     def publish(self, event: Event) -> None:
         """Publish an event to subscribers."""
 
-        callbacks: Iterable[Callback]
-        with self._lock:
-            callbacks = list(self._subscribers.get(event.name, []))
-        for callback in callbacks:
+        for callback in self._subscribers.get(event.name, ()):
             try:
                 callback(event)
             except Exception as exc:  # pragma: no cover - defensive logging
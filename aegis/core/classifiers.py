@@ -3,12 +3,30 @@
 
 
 import mimetypes
+import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 URL_REGEX = re.compile(r"https?://[\w\-./?=&%]+", re.IGNORECASE)
 CODE_HINT_REGEX = re.compile(r"(def |class |function |var |const |#include|import )")
+# Both of the above in one pass; only the URL half ignores case, as URL_REGEX does
+_CLASSIFY_REGEX = re.compile(
+    rf"(?P<url>(?i:{URL_REGEX.pattern}))|(?P<code>{CODE_HINT_REGEX.pattern})"
+)
+
+ARCHIVE_EXTENSIONS = frozenset({".zip", ".rar", ".7z"})
+
+# suffix -> (label, fallback mime)
+_SUFFIX_LABELS = {
+    **{suffix: ("archive", "application/zip") for suffix in ARCHIVE_EXTENSIONS},
+    ".png": ("image", "image/png"),
+    ".jpg": ("image", "image/png"),
+    ".jpeg": ("image", "image/png"),
+    ".pdf": ("document", "application/pdf"),
+}
+_DEFAULT_FILE_LABEL = ("file", "application/octet-stream")
 
 
 @dataclass
@@ -20,9 +38,11 @@ class Classification:
 def classify_text(text: str) -> Classification:
     """Classify clipboard text heuristically."""
 
-    if URL_REGEX.search(text):
-        return Classification(label="url", details={"clean": text.strip()})
-    if CODE_HINT_REGEX.search(text):
+    match = _CLASSIFY_REGEX.search(text)
+    if match is not None:
+        # A URL anywhere wins over code hints, so keep looking past an earlier hint
+        if match.lastgroup == "url" or URL_REGEX.search(text, match.end()):
+            return Classification(label="url", details={"clean": text.strip()})
         lang = detect_code_language(text)
         return Classification(label="code", details={"language": lang})
     if len(text.split()) <= 6:
@@ -43,16 +63,35 @@ def detect_code_language(text: str) -> str:
     return "text"
 
 
-def classify_file(path: Path) -> Classification:
-    mime, _ = mimetypes.guess_type(path.name)
-    if path.suffix.lower() in {".zip", ".rar", ".7z"}:
-        return Classification(label="archive", details={"mime": mime or "application/zip"})
-    if path.suffix.lower() in {".png", ".jpg", ".jpeg"}:
-        return Classification(label="image", details={"mime": mime or "image/png"})
-    if path.suffix.lower() in {".pdf"}:
-        return Classification(label="document", details={"mime": mime or "application/pdf"})
-    return Classification(label="file", details={"mime": mime or "application/octet-stream"})
+@lru_cache(maxsize=256)
+def _classify_name(name: str) -> tuple[str, str]:
+    mime, _ = mimetypes.guess_type(name)
+    label, fallback = _SUFFIX_LABELS.get(Path(name).suffix.lower(), _DEFAULT_FILE_LABEL)
+    return label, mime or fallback
 
 
-__all__ = ["Classification", "classify_text", "classify_file", "detect_code_language"]
+def _suffix_key(name: str) -> str:
+    # guess_type and Path.suffix never look further back than the last two extensions
+    # (".tar.gz"), so a stand-in stem classifies the same as the real name. Dotfiles
+    # keep their name since leading dots are not treated as extensions.
+    if name.startswith("."):
+        return name
+    base, ext = os.path.splitext(name)
+    return "x" + os.path.splitext(base)[1] + ext
+
+
+def classify_file(path: Path) -> Classification:
+    # Cached per extension rather than per name, so a burst of new downloads of the
+    # same type all hit the cache
+    label, mime = _classify_name(_suffix_key(path.name))
+    return Classification(label=label, details={"mime": mime})
+
+
+__all__ = [
+    "ARCHIVE_EXTENSIONS",
+    "Classification",
+    "classify_text",
+    "classify_file",
+    "detect_code_language",
+]
 
@@ -8,12 +8,22 @@ from pathlib import Path
 __all__ = ["sha256_file"]
 
 
+# hashlib.file_digest (Python 3.11+) runs the read/update loop in C
+_FILE_DIGEST = getattr(hashlib, "file_digest", None)
+
+
 def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Return the SHA-256 digest of ``path`` without loading it entirely."""
+    """Return the SHA-256 digest of ``path`` without loading it entirely.
 
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
+    ``chunk_size`` only applies on Python 3.10, where the file is read in Python.
+    """
+
+    # Plain reads rather than mmap: callers hash downloads that may still be growing or
+    # being truncated, and a mapped file shrinking underneath us is a fatal SIGBUS.
+    with path.open("rb", buffering=0) as handle:
+        if _FILE_DIGEST is not None:
+            return _FILE_DIGEST(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
         for chunk in iter(lambda: handle.read(chunk_size), b""):
             digest.update(chunk)
-    return digest.hexdigest()
-
+        return digest.hexdigest()
@@ -10,17 +10,21 @@ from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 from .utils import hash_text, sanitize_filename
 
-TRACKING_PARAMS = {
-    "utm_source",
-    "utm_medium",
-    "utm_campaign",
-    "utm_term",
-    "utm_content",
-    "gclid",
-    "fbclid",
-    "mc_eid",
-    "msclkid",
-}
+TRACKING_PARAMS = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "gclid",
+        "fbclid",
+        "mc_eid",
+        "msclkid",
+    }
+)
+# Every tracking key contains one of these
+_TRACKING_MARKERS = ("utm_", "gclid", "fbclid", "mc_eid", "msclkid")
 
 
 def summarize_text(text: str, max_chars: int = 200) -> str:
@@ -48,9 +52,18 @@ def _split_sentences(text: str) -> list[str]:
 
 
 def clean_tracking_url(url: str) -> str:
-    parsed = urlparse(url.strip())
+    url = url.strip()
+    _, sep, query = url.partition("?")
+    if not sep:
+        return url
+    lowered = query.lower()
+    # Most URLs carry no tracking keys: skip the parse/re-encode round trip. Keys
+    # may be percent-encoded, so any escape still takes the full path.
+    if "%" not in lowered and not any(marker in lowered for marker in _TRACKING_MARKERS):
+        return url
+    parsed = urlparse(url)
     if not parsed.scheme:
-        return url.strip()
+        return url
     filtered = [
         (key, value)
         for key, value in parse_qsl(parsed.query, keep_blank_values=True)
@@ -69,11 +82,35 @@ LANGUAGE_HINTS = {
 }
 
 
+def _compile_language_hints() -> tuple[re.Pattern[str], dict[str, int]]:
+    """Build one scanner for every hint, mapping each hint to its best-ranked language."""
+
+    rank: dict[str, int] = {}
+    for priority, patterns in enumerate(LANGUAGE_HINTS.values()):
+        for pattern in patterns:
+            rank.setdefault(pattern.lower(), priority)
+    # Higher-priority hints first so they win when several start at the same offset;
+    # the lookahead reports overlapping hits instead of consuming the text.
+    ordered = sorted(rank, key=rank.__getitem__)
+    alternation = "|".join(re.escape(pattern) for pattern in ordered)
+    return re.compile(f"(?=({alternation}))"), rank
+
+
+_HINT_SCANNER, _HINT_RANK = _compile_language_hints()
+_LANGUAGES = tuple(LANGUAGE_HINTS)
+
+
 def detect_code_language(text: str) -> str:
     lowered = text.lower()
-    for language, patterns in list(LANGUAGE_HINTS.items()):
-        if any(pattern.lower() in lowered for pattern in patterns):
-            return language
+    best = len(_LANGUAGES)
+    for match in _HINT_SCANNER.finditer(lowered):
+        priority = _HINT_RANK[match.group(1)]
+        if priority < best:
+            best = priority
+            if best == 0:
+                break
+    if best < len(_LANGUAGES):
+        return _LANGUAGES[best]
     if lowered.strip().startswith("<html"):
         return "html"
     return "text"
@@ -105,15 +142,19 @@ def generate_filename(path: Path, keywords: Sequence[str]) -> str:
     return f"{base}_{timestamp}_{digest}{path.suffix.lower()}"
 
 
+_KEYWORD_SPLIT = re.compile(r"[^A-Za-z0-9]+")
+
+
 def _tokenize_keywords(keywords: Iterable[str]) -> list[str]:
-    tokens: list[str] = []
-    for keyword in keywords:
-        for piece in re.split(r"[^A-Za-z0-9]+", keyword):
-            if piece:
-                lower = piece.lower()
-                if lower not in tokens:
-                    tokens.append(lower)
-    return tokens
+    # dict.fromkeys dedupes in first-seen order with one hash lookup per piece
+    return list(
+        dict.fromkeys(
+            piece.lower()
+            for keyword in keywords
+            for piece in _KEYWORD_SPLIT.split(keyword)
+            if piece
+        )
+    )
 
 
 __all__ = [
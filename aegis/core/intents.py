@@ -4,10 +4,16 @@
 
 import logging
 import re
+import threading
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import Callable, Dict
 
+try:  # pragma: no cover - optional dependency
+    from rapidfuzz import fuzz  # type: ignore
+except ImportError:  # pragma: no cover
+    fuzz = None  # type: ignore
+
 from ..config.schema import AppConfig
 from .bus import EventBus, ClipboardEvent, NotificationEvent
 from .summarizer import Summarizer
@@ -15,8 +21,45 @@ from .summarizer import Summarizer
 LOGGER = logging.getLogger(__name__)
 
 
-def _fuzzy_score(text: str, keyword: str) -> float:
-    return SequenceMatcher(None, text, keyword).ratio() * 100
+KEYWORD_HEURISTICS: Dict[str, list[str]] = {
+    "summarize_clipboard": ["summarize", "tl;dr"],
+    "organize_desktop_now": ["clean desktop", "organize desktop"],
+    "organize_downloads_now": ["clean downloads", "organize downloads"],
+    "rename_last_file": ["rename", "retitle"],
+    "find_in_vault": ["find", "search"],
+    "pause_watchers": ["pause", "snooze"],
+    "wipe_vault": ["wipe vault", "clear history"],
+}
+
+# (intent, keyword) in match order
+_KEYWORDS = [
+    (intent_name, keyword)
+    for intent_name, keywords in KEYWORD_HEURISTICS.items()
+    for keyword in keywords
+]
+# One matcher per keyword and thread: SequenceMatcher indexes its second sequence once,
+# but set_seq1 mutates it, and parse runs on the palette, hotkey and tray threads
+_MATCHERS = threading.local()
+_PAUSE_MINUTES = re.compile(r"pause .*?(\d+)")
+
+
+def _fuzzy_score(text: str, keyword: str, cutoff: float = 0.0) -> float:
+    """Similarity of ``text`` and ``keyword`` in percent; 0 when below ``cutoff``."""
+
+    if fuzz is not None:
+        return fuzz.ratio(text, keyword, score_cutoff=cutoff)
+    matchers: Dict[str, SequenceMatcher] | None = getattr(_MATCHERS, "by_keyword", None)
+    if matchers is None:
+        matchers = _MATCHERS.by_keyword = {}
+    matcher = matchers.get(keyword)
+    if matcher is None:
+        matcher = matchers[keyword] = SequenceMatcher(None, "", keyword)
+    matcher.set_seq1(text)
+    # The quick ratios are upper bounds of ratio(); most keywords fail them outright
+    if matcher.real_quick_ratio() * 100 < cutoff or matcher.quick_ratio() * 100 < cutoff:
+        return 0.0
+    score = matcher.ratio() * 100
+    return score if score >= cutoff else 0.0
 
 
 @dataclass
@@ -70,23 +113,13 @@ class IntentRouter:
 
     def parse(self, text: str) -> Intent:
         text_lower = text.lower().strip()
-        heuristics = {
-            "summarize_clipboard": ["summarize", "tl;dr"],
-            "organize_desktop_now": ["clean desktop", "organize desktop"],
-            "organize_downloads_now": ["clean downloads", "organize downloads"],
-            "rename_last_file": ["rename", "retitle"],
-            "find_in_vault": ["find", "search"],
-            "pause_watchers": ["pause", "snooze"],
-            "wipe_vault": ["wipe vault", "clear history"],
-        }
-        for intent_name, keywords in list(heuristics.items()):
-            for keyword in keywords:
-                score = _fuzzy_score(text_lower, keyword)
-                if score >= 80:
-                    LOGGER.debug("Matched intent %s with score %s", intent_name, score)
-                    return Intent(name=intent_name, params={}, confidence=score / 100)
-
-        match = re.search(r"pause .*?(\d+)", text_lower)
+        for intent_name, keyword in _KEYWORDS:
+            score = _fuzzy_score(text_lower, keyword, cutoff=80)
+            if score:
+                LOGGER.debug("Matched intent %s with score %s", intent_name, score)
+                return Intent(name=intent_name, params={}, confidence=score / 100)
+
+        match = _PAUSE_MINUTES.search(text_lower)
         if match:
             minutes = int(match.group(1))
             return Intent(name="pause_watchers", params={"minutes": minutes}, confidence=0.8)
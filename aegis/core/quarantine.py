@@ -11,9 +11,6 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from zipfile import ZipFile
-import logging
-import shutil
-from pathlib import Path
 
 from ..config.schema import AppConfig
 from .utils import ensure_directory
@@ -36,14 +33,12 @@ class QuarantineRecord:
 
 class Quarantine:
     """Move suspicious files into a read-only quarantine folder with reporting."""
-class Quarantine:
-    """Move suspicious files into a read-only quarantine folder."""
 
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        self.root = Path(config.quarantine_root).expanduser()
+        self.root = config.quarantine_dir
         ensure_directory(self.root)
-        self.reports_root = Path(config.reports_root).expanduser() / "quarantine"
+        self.reports_root = config.reports_dir / "quarantine"
         ensure_directory(self.reports_root)
 
     def inspect_archive(self, path: Path) -> list[str]:
@@ -68,13 +63,6 @@ class Quarantine:
 
     def isolate(self, path: Path, reason: str, source: str, indicators: list[str] | None = None) -> QuarantineRecord:
         destination = self._reserve_destination(path.name)
-
-    def isolate(self, path: Path) -> Path:
-        destination = self.root / path.name
-        counter = 1
-        while destination.exists():
-            destination = self.root / f"{path.stem}-{counter}{path.suffix}"
-            counter += 1
         LOGGER.info("Quarantining %s", path)
         shutil.move(str(path), destination)
         try:
@@ -149,8 +137,4 @@ th {{ background: #fef3c7; }}
 
 
 __all__ = ["Quarantine", "QuarantineRecord"]
-        return destination
-
-
-__all__ = ["Quarantine"]
 
@@ -7,9 +7,10 @@ import hashlib
 import os
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 try:  # pragma: no cover - optional dependency
     from cryptography.fernet import Fernet  # type: ignore
@@ -37,6 +38,8 @@ class ClipboardVault:
         self._fernet: Optional["Fernet"] = None
         self._xor_key: Optional[bytes] = None
         self._connection: sqlite3.Connection | None = None
+        # Writes arrive from the executor's vault worker, reads from UI threads
+        self._lock = threading.Lock()
         self._enabled = False
         if self.config.clipboard_vault.enabled:
             self._enabled = self._initialize()
@@ -46,21 +49,13 @@ class ClipboardVault:
         if not key_material:
             LOGGER.warning("Clipboard vault enabled but no passphrase provided; disabling vault")
             return False
-        if self.config.clipboard_vault.enabled:
-            self._initialize()
-
-    def _initialize(self) -> None:
-        key_material = self._derive_key()
-        if not key_material:
-            LOGGER.warning("Clipboard vault enabled but no passphrase provided; disabling vault")
-            return
         if Fernet is not None:
             self._fernet = Fernet(base64.urlsafe_b64encode(key_material))
             LOGGER.info("Using AES-Fernet backend for clipboard vault")
         else:
             self._xor_key = key_material
             LOGGER.info("Using lightweight XOR fallback for clipboard vault")
-        self._connection = sqlite3.connect(self.db_path)
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self._connection.execute(
             """
             CREATE TABLE IF NOT EXISTS entries (
@@ -90,7 +85,6 @@ class ClipboardVault:
             f"DELETE FROM entries WHERE id NOT IN ({placeholders})",
             keep_ids,
         )
-        self._connection.commit()
 
     def _derive_key(self) -> bytes | None:
         passphrase = self._load_passphrase()
@@ -138,36 +132,50 @@ class ClipboardVault:
         return data.decode("utf-8")
 
     def store(self, content: str) -> None:
+        self.store_many([content])
+
+    def store_many(self, contents: Iterable[str]) -> None:
+        """Store several entries in one transaction, pruning and committing once."""
+
         if not self._enabled or not (self._fernet or self._xor_key) or not self._connection:
-        if not (self._fernet or self._xor_key) or not self._connection:
             return
-        classification = classify_text(content)
-        preview = content[:120].replace("\n", " ")
-        payload = self._encrypt(content)
-        self._connection.execute(
-            "INSERT INTO entries (created_at, entry_type, preview, payload) VALUES (?, ?, ?, ?)",
+        created_at = datetime.utcnow().isoformat()
+        rows = [
             (
-                datetime.utcnow().isoformat(),
-                classification.label,
-                preview,
-                payload,
-            ),
-        )
-        self._connection.commit()
-        self._prune_entries()
+                created_at,
+                classify_text(content).label,
+                content[:120].replace("\n", " "),
+                self._encrypt(content),
+            )
+            for content in contents
+        ]
+        if not rows:
+            return
+        with self._lock:
+            if not self._connection:
+                return
+            # Commits on success and rolls back on error, so a failed batch never
+            # leaves a transaction open for the next write
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO entries (created_at, entry_type, preview, payload)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                self._prune_entries()
 
     def search(self, query: str) -> List[str]:
         if not self._enabled or not (self._fernet or self._xor_key) or not self._connection:
-
-    def search(self, query: str) -> List[str]:
-        if not (self._fernet or self._xor_key) or not self._connection:
             return []
-        cursor = self._connection.execute(
-            "SELECT payload FROM entries WHERE preview LIKE ? ORDER BY id DESC LIMIT ?",
-            (f"%{query}%", self.config.clipboard_vault.max_items),
-        )
+        with self._lock:
+            if not self._connection:
+                return []
+            rows = self._connection.execute(
+                "SELECT payload FROM entries WHERE preview LIKE ? ORDER BY id DESC LIMIT ?",
+                (f"%{query}%", self.config.clipboard_vault.max_items),
+            ).fetchall()
         results = []
-        for (payload,) in cursor.fetchall():
+        for (payload,) in rows:
             try:
                 decrypted = self._decrypt(payload)
                 results.append(decrypted)
@@ -176,15 +184,17 @@ class ClipboardVault:
         return results
 
     def wipe(self) -> None:
-        if not self._connection:
-            return
-        self._connection.execute("DELETE FROM entries")
-        self._connection.commit()
+        with self._lock:
+            if not self._connection:
+                return
+            with self._connection:
+                self._connection.execute("DELETE FROM entries")
 
     def close(self) -> None:
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
 
     def __del__(self) -> None:  # pragma: no cover
         try:
@@ -9,7 +9,6 @@ from typing import Optional
 import click
 
 from .config.schema import AppConfig, config_dir, load_config
-from .config.schema import AppConfig, load_config
 from .core.bus import EventBus
 from .core.scheduler import SchedulerService
 from .core.actions import ActionExecutor
@@ -46,14 +45,14 @@ class Application:
         self.downloads_watcher: Optional[DirectoryWatcher] = None
         if config.watchers.desktop:
             self.desktop_watcher = DirectoryWatcher(
-                root=Path(config.desktop_path).expanduser(),
+                root=config.desktop_dir,
                 bus=self.bus,
                 config=config,
                 label="desktop",
             )
         if config.watchers.downloads:
             self.downloads_watcher = DirectoryWatcher(
-                root=Path(config.downloads_path).expanduser(),
+                root=config.downloads_dir,
                 bus=self.bus,
                 config=config,
                 label="downloads",
@@ -109,7 +108,7 @@ class Application:
             self.tray.stop()
         if self.hotkey:
             self.hotkey.stop()
-        self.action_executor.vault.close()
+        self.action_executor.close()
 
     # UI callbacks ---------------------------------------------------------
     def _show_palette(self) -> None:
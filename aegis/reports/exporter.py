@@ -8,9 +8,6 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict
 from html import escape
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict
 
 from ..config.schema import AppConfig
 from ..core.utils import ensure_directory
@@ -54,13 +51,12 @@ class ReportExporter:
 
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        self.reports_root = Path(config.reports_root).expanduser()
+        self.reports_root = config.reports_dir
         ensure_directory(self.reports_root)
 
     def export_latest(self, include_html: bool = False) -> str:
         data = self._gather_data()
         timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        timestamp = datetime.utcnow().isoformat()
         json_path = self.reports_root / f"report-{timestamp}.json"
         json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
         summary = f"Report written to {json_path}"
@@ -73,7 +69,7 @@ class ReportExporter:
     def _gather_data(self) -> Dict[str, Any]:
         items = [{"event": "archive", "details": "No events captured in offline demo"}]
         quarantine_dir = self.reports_root / "quarantine"
-        snippet_root = Path(self.config.snippets_root).expanduser()
+        snippet_root = self.config.snippets_dir
         cutoff = datetime.utcnow() - timedelta(days=1)
         snippet_count = 0
         if snippet_root.exists():
@@ -106,20 +102,6 @@ class ReportExporter:
         return _report_template().replace("{{ generated_at }}", escape(data["generated_at"])).replace(
             "{% for item in items %}\n<tr><td>{{ item.event }}</td><td>{{ item.details }}</td></tr>\n{% endfor %}",
             rows or "<tr><td>info</td><td>No recent activity recorded</td></tr>",
-        return {
-            "generated_at": datetime.utcnow().isoformat(),
-            "items": [
-                {"event": "archive", "details": "No events captured in offline demo"},
-            ],
-        }
-
-    def _render_html(self, data: Dict[str, Any]) -> str:
-        template = _report_template()
-        return template.replace("{{ generated_at }}", data["generated_at"]).replace(
-            "{% for item in items %}\n<tr><td>{{ item.event }}</td><td>{{ item.details }}</td></tr>\n{% endfor %}",
-            "\n".join(
-                f"<tr><td>{item['event']}</td><td>{item['details']}</td></tr>" for item in data.get("items", [])
-            ),
         )
 
 
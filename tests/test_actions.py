@@ -1,5 +1,6 @@
 
 
+import errno
 import os
 import time
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 from aegis.core.actions import ActionExecutor
 from aegis.core.bus import EventBus
 from aegis.core.notifier import Notifier
+from aegis.core.vault import ClipboardVault
 
 
 class DummyNotifier(Notifier):
@@ -32,6 +34,31 @@ def test_organize_directory_moves_files(app_config) -> None:
         assert path.exists()
 
 
+def test_organize_directory_never_overwrites_archived_files(app_config) -> None:
+    executor = ActionExecutor(EventBus(), DummyNotifier(), app_config)
+    archive_root, _ = executor._prepare_archive_folder()
+    existing = archive_root / "report.pdf"
+    existing.write_text("archived", encoding="utf-8")
+    (Path(app_config.desktop_path) / "Report.PDF").write_text("new", encoding="utf-8")
+    result = executor.organize_directory("desktop")
+    assert [path.name for path in result.moved_files] == ["Report-1.PDF"]
+    assert existing.read_text(encoding="utf-8") == "archived"
+
+
+def test_archive_entry_retries_when_name_was_taken_after_listing(app_config) -> None:
+    executor = ActionExecutor(EventBus(), DummyNotifier(), app_config)
+    archive_root, used_names = executor._prepare_archive_folder()
+    downloads = Path(app_config.downloads_path)
+    (downloads / "notes.txt").write_text("new", encoding="utf-8")
+    # Appears after the folder was listed, e.g. from another archiving thread
+    (archive_root / "notes.txt").write_text("archived", encoding="utf-8")
+    with os.scandir(downloads) as it:
+        entry = next(it)
+    destination = executor._archive_entry(entry, archive_root, used_names, same_fs=True)
+    assert destination.name == "notes-1.txt"
+    assert (archive_root / "notes.txt").read_text(encoding="utf-8") == "archived"
+
+
 def test_rename_last_file(app_config) -> None:
     bus = EventBus()
     notifier = DummyNotifier()
@@ -61,6 +88,25 @@ def test_archive_old_files(app_config) -> None:
 
 
 
+def test_archive_falls_back_to_copy_when_rename_crosses_mounts(app_config, monkeypatch) -> None:
+    # Bind mounts can share st_dev with the archive and still refuse link/rename
+    def refuse(*args, **kwargs):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "link", refuse)
+    monkeypatch.setattr(os, "replace", refuse)
+    executor = ActionExecutor(EventBus(), DummyNotifier(), app_config)
+    (Path(app_config.desktop_path) / "a.txt").write_text("a", encoding="utf-8")
+    old_file = Path(app_config.downloads_path) / "b.txt"
+    old_file.write_text("b", encoding="utf-8")
+    old_time = time.time() - 60 * 60 * 24 * 10
+    os.utime(old_file, (old_time, old_time))
+    moved = executor.organize_directory("desktop").moved_files
+    moved += executor.archive_old_files(age_days=7).moved_files
+    assert [path.read_text(encoding="utf-8") for path in moved] == ["a", "b"]
+    assert not old_file.exists()
+
+
 def test_record_clipboard_saves_code_snippet(app_config) -> None:
     bus = EventBus()
     notifier = DummyNotifier()
@@ -83,3 +129,12 @@ def test_record_clipboard_cleans_url(app_config) -> None:
     assert snapshot == "https://example.com/path?ref=123"
     assert notifier.messages
     assert "Cleaned tracking parameters" in notifier.messages[0]
+
+
+def test_wipe_vault_covers_queued_entries(app_config) -> None:
+    executor = ActionExecutor(EventBus(), DummyNotifier(), app_config)
+    for index in range(10):
+        executor.record_clipboard(f"private note {index}")
+    executor.wipe_vault()
+    executor.close()
+    assert ClipboardVault(app_config).search("private") == []